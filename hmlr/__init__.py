@@ -26,6 +26,16 @@ Example:
 
 __version__ = "0.1.0"
 
-from .client import HMLRClient
+__all__ = ["HMLRClient", "HMLRModelWarning"]
 
-__all__ = ["HMLRClient"]
+
+def __getattr__(name):
+    """Lazily import public names so `import hmlr` stays cheap (PEP 562)."""
+    if name in __all__:
+        from . import client
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
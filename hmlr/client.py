@@ -6,9 +6,14 @@ component factory and conversation engine.
 """
 
 import os
+import time
 import warnings
-from typing import Optional, Dict, Any
-from .core.component_factory import ComponentFactory
+from collections import deque
+from typing import Optional, Dict, Any, Set
+
+
+class HMLRModelWarning(UserWarning):
+    """Issued when HMLRClient is used with a model other than gpt-4.1-mini."""
 
 
 class HMLRClient:
@@ -32,6 +37,12 @@ class HMLRClient:
     WARNING: Only tested with gpt-4.1-mini. Other models may fail.
     """
     
+    # Untested models already warned about in this process
+    _warned_models: Set[str] = set()
+    
+    # Preceding user messages a semantic cache hit must also match
+    SEM_CACHE_CONTEXT_TURNS = 3
+    
     def __init__(
         self,
         api_key: str,
@@ -41,6 +52,11 @@ class HMLRClient:
         context_budget_tokens: int = 12000,
         max_sliding_window_turns: int = 15,
         crawler_recency_weight: float = 0.3,
+        requests_per_minute: int = 500,
+        tokens_per_minute: int = 200000,
+        max_concurrent_requests: int = 8,
+        sem_cache_threshold: Optional[float] = None,
+        use_mmap: bool = True,
         **kwargs
     ):
         """
@@ -55,18 +71,26 @@ class HMLRClient:
             context_budget_tokens: Max tokens for context (default: 12000)
             max_sliding_window_turns: Max turns in sliding window (default: 15)
             crawler_recency_weight: Weight for recent turns in retrieval (default: 0.3)
+            requests_per_minute: OpenAI request budget per minute (default: 500)
+            tokens_per_minute: OpenAI token budget per minute (default: 200000);
+                               set these to your account's limits
+            max_concurrent_requests: Max in-flight OpenAI requests (default: 8)
+            sem_cache_threshold: Cosine similarity for semantic cache hits,
+                                 e.g. 0.92 (default: None, cache disabled)
+            use_mmap: Memory-map the SQLite database file (default: True);
+                      disable on network filesystems where mmap I/O errors
+                      would crash the process
             **kwargs: Additional configuration options
         """
+        # Heavy imports (storage, embeddings, retrieval) are deferred to here
+        # so that `import hmlr` stays cheap
+        from .core.component_factory import ComponentFactory
+        from .core.semantic_cache import SemanticCache
+        from .core.embedding_cache import embedding_cache
+        
         # Model compatibility warning
         if model != "gpt-4.1-mini":
-            warnings.warn(
-                f"⚠️  Model '{model}' has NOT been tested!\n"
-                f"HMLR is only validated with 'gpt-4.1-mini'.\n"
-                f"Other models may produce incorrect results or fail completely.\n"
-                f"Use at your own risk!",
-                UserWarning,
-                stacklevel=2
-            )
+            self._warn_model_once(model)
         
         # Set API key and database path in environment
         os.environ["OPENAI_API_KEY"] = api_key
@@ -83,16 +107,67 @@ class HMLRClient:
             use_llm_intent_mode=use_llm_intent_mode,
             context_budget_tokens=context_budget_tokens,
             max_sliding_window_turns=max_sliding_window_turns,
-            crawler_recency_weight=crawler_recency_weight
+            crawler_recency_weight=crawler_recency_weight,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            max_concurrent_requests=max_concurrent_requests,
+            use_mmap=use_mmap
         )
         
-        # Create conversation engine
-        self.engine = ComponentFactory.create_conversation_engine(
-            self.components
+        # Share the process-wide embedding cache with other clients
+        embedding_cache.attach(self.components.embedding_storage)
+        
+        # Conversation engine is created on first use (see `engine`)
+        self._engine = None
+        
+        # Semantic cache for near-duplicate queries
+        self._sem_cache = (
+            SemanticCache(threshold=sem_cache_threshold)
+            if sem_cache_threshold is not None else None
         )
+        self._recent_query_vecs = deque(maxlen=self.SEM_CACHE_CONTEXT_TURNS)
+        
+        # (monotonic timestamp, count) memo for get_memory_stats
+        self._turn_count_cache = None
         
         print(f"✅ HMLR initialized successfully")
     
+    @classmethod
+    def _warn_model_once(cls, model: str) -> None:
+        """
+        Warn that a model is untested, at most once per model per process.
+        
+        Args:
+            model: Model name passed to HMLRClient
+        """
+        if model in cls._warned_models:
+            return
+        cls._warned_models.add(model)
+        
+        warnings.warn(
+            f"⚠️  Model '{model}' has NOT been tested!\n"
+            f"HMLR is only validated with 'gpt-4.1-mini'.\n"
+            f"Other models may produce incorrect results or fail completely.\n"
+            f"Use at your own risk!",
+            HMLRModelWarning,
+            stacklevel=3
+        )
+    
+    @property
+    def engine(self):
+        """
+        ConversationEngine, created on first access.
+        
+        Building the engine resolves the lazy subsystems (Governor, Scribe,
+        FactScrubber, synthesis), so clients that never chat never pay for them.
+        """
+        if self._engine is None:
+            from .core.component_factory import ComponentFactory
+            self._engine = ComponentFactory.create_conversation_engine(
+                self.components
+            )
+        return self._engine
+    
     async def chat(
         self,
         message: str,
@@ -112,18 +187,59 @@ class HMLRClient:
             - content: The AI's response text
             - status: Response status (success/error)
             - metadata: Additional information about the response
+        
+        With the semantic cache enabled, near-duplicate questions asked in
+        the same conversational context are answered without running the
+        Governor or main LLM. The turn is still appended to the active
+        Bridge Block and logged to storage, the sliding window and the
+        embedding index.
         """
+        use_cache = self._sem_cache is not None and force_intent is None
+        query_vec = self._embed_query(message) if use_cache else None
+        context = tuple(self._recent_query_vecs)
+        
+        if query_vec is not None:
+            cached = self._sem_cache.lookup(query_vec, context)
+            self._recent_query_vecs.append(query_vec)
+            if cached is not None:
+                self.engine.log_cached_turn(message, cached["content"])
+                return {
+                    **cached,
+                    "metadata": {**cached["metadata"], "semantic_cache_hit": True}
+                }
+        
         response = await self.engine.process_user_message(
             message,
             force_intent=force_intent,
             **kwargs
         )
         
-        return {
+        result = {
             "content": response.content,
             "status": response.status.value,
             "metadata": response.metadata if hasattr(response, 'metadata') else {}
         }
+        
+        if query_vec is not None and result["status"] == "success":
+            self._sem_cache.store(query_vec, result, context)
+        
+        return result
+    
+    def _embed_query(self, message: str):
+        """
+        Embed a user message for semantic cache lookup.
+        
+        Returns:
+            L2-normalized embedding, or None if embedding is unavailable
+        """
+        from .core.semantic_cache import SemanticCache
+        
+        try:
+            embedding_manager = self.components.embedding_storage.embedding_manager
+            return SemanticCache.normalize(embedding_manager.encode_cached(message))
+        except Exception as e:
+            print(f"⚠️  Semantic cache unavailable: {e}")
+            return None
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """
@@ -135,13 +251,11 @@ class HMLRClient:
             - sliding_window_size: Current sliding window size
             - db_path: Path to database file
             - model: Model being used
+            - embedding_cache_hit_rate: Fraction of embeddings served from cache
         """
-        storage = self.components.storage
-        
-        # Get total turns (try to get all, fall back to estimate)
+        # Get total turns (COUNT(*), memoized for a second)
         try:
-            all_turns = storage.get_recent_turns(day_id=None, limit=100000)
-            total_turns = len(all_turns)
+            total_turns = self._count_turns()
         except Exception:
             total_turns = "unknown"
         
@@ -149,9 +263,22 @@ class HMLRClient:
             "total_turns": total_turns,
             "sliding_window_size": len(self.components.sliding_window.turns),
             "db_path": self.db_path,
-            "model": self.model
+            "model": self.model,
+            "embedding_cache_hit_rate": self.components.embedding_storage.embedding_manager.cache.hit_rate
         }
     
+    def _count_turns(self, max_age_seconds: float = 1.0) -> int:
+        """
+        Count stored turns, reusing the last count for up to max_age_seconds.
+        """
+        now = time.monotonic()
+        if self._turn_count_cache and now - self._turn_count_cache[0] < max_age_seconds:
+            return self._turn_count_cache[1]
+        
+        count = self.components.storage.count_turns()
+        self._turn_count_cache = (now, count)
+        return count
+    
     def get_recent_conversations(self, limit: int = 10) -> list:
         """
         Get recent conversation turns.
@@ -165,6 +292,17 @@ class HMLRClient:
         storage = self.components.storage
         return storage.get_recent_turns(day_id=None, limit=limit)
     
+    def clear_embedding_cache(self):
+        """
+        Clear the process-wide embedding cache.
+        
+        The cache is shared by every HMLRClient in the process, so this
+        affects all of them. Mainly useful for tests and benchmarks.
+        """
+        from .core.embedding_cache import embedding_cache
+        
+        embedding_cache.clear()
+    
     def clear_sliding_window(self):
         """
         Clear the sliding window (keeps database intact).
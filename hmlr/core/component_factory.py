@@ -9,8 +9,9 @@ Extracted from main.py as part of Phase 3 refactor.
 """
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+from functools import cached_property
+from itertools import islice
+from typing import Dict, Optional, TYPE_CHECKING
 from hmlr.memory import Storage
 from hmlr.memory.conversation_manager import ConversationManager
 from hmlr.memory.models import SlidingWindow
@@ -19,55 +20,147 @@ from hmlr.memory.embeddings.embedding_manager import EmbeddingManager, Embedding
 from hmlr.memory.retrieval.intent_analyzer import IntentAnalyzer
 from hmlr.memory.retrieval.crawler import LatticeCrawler
 from hmlr.memory.retrieval.context_hydrator import ContextHydrator
-from hmlr.memory.retrieval.lattice import LatticeRetrieval, TheGovernor
+from hmlr.memory.retrieval.lattice import LatticeRetrieval
 from hmlr.memory.retrieval.hmlr_hydrator import Hydrator
-from hmlr.memory.synthesis import SynthesisManager
-from hmlr.memory.synthesis.user_profile_manager import UserProfileManager
-from hmlr.memory.synthesis.scribe import Scribe
-from hmlr.memory.chunking.chunk_engine import ChunkEngine
-from hmlr.memory.fact_scrubber import FactScrubber
 from hmlr.core.cognitive_lattice import SessionManager
 
+if TYPE_CHECKING:
+    from hmlr.core.external_api_client import ExternalAPIClient
+    from hmlr.memory.retrieval.lattice import TheGovernor
+    from hmlr.memory.synthesis import SynthesisManager
+    from hmlr.memory.synthesis.user_profile_manager import UserProfileManager
+    from hmlr.memory.synthesis.scribe import Scribe
+    from hmlr.memory.chunking.chunk_engine import ChunkEngine
+    from hmlr.memory.fact_scrubber import FactScrubber
+
 
-@dataclass
 class ComponentBundle:
     """
     Container for all initialized CognitiveLattice components.
     
     This bundle provides all components needed by ConversationEngine
     and other parts of the system, properly initialized and wired together.
+    
+    Core storage, retrieval and utility components are built eagerly.
+    Optional subsystems (external API, Governor, Scribe, FactScrubber,
+    synthesis, chunking) are cached properties, imported and constructed
+    on first access so cold start only pays for what is actually used.
     """
-    # Core storage and state
-    storage: Storage
-    conversation_mgr: ConversationManager
-    sliding_window: SlidingWindow
-    session_manager: SessionManager
     
-    # Retrieval components
-    crawler: LatticeCrawler
-    intent_analyzer: IntentAnalyzer
-    context_hydrator: ContextHydrator
+    def __init__(
+        self,
+        storage: Storage,
+        conversation_mgr: ConversationManager,
+        sliding_window: SlidingWindow,
+        session_manager: SessionManager,
+        crawler: LatticeCrawler,
+        intent_analyzer: IntentAnalyzer,
+        context_hydrator: ContextHydrator,
+        lattice_retrieval: LatticeRetrieval,
+        hydrator: Hydrator,
+        metadata_extractor: LLMMetadataExtractor,
+        embedding_storage: EmbeddingStorage,
+        previous_day: str,
+        rate_limits: Optional[Dict[str, int]] = None
+    ):
+        # Core storage and state
+        self.storage = storage
+        self.conversation_mgr = conversation_mgr
+        self.sliding_window = sliding_window
+        self.session_manager = session_manager
+        
+        # Retrieval components
+        self.crawler = crawler
+        self.intent_analyzer = intent_analyzer
+        self.context_hydrator = context_hydrator
+        
+        # HMLR Components
+        self.lattice_retrieval = lattice_retrieval
+        self.hydrator = hydrator
+        
+        # Utilities
+        self.metadata_extractor = metadata_extractor
+        self.embedding_storage = embedding_storage
+        
+        # Session state
+        self.previous_day = previous_day
+        
+        # RateLimiter kwargs for the shared external API client
+        self.rate_limits = rate_limits or {}
+    
+    # === External Services === #
     
-    # HMLR Components
-    lattice_retrieval: LatticeRetrieval
-    governor: TheGovernor
-    hydrator: Hydrator
+    @cached_property
+    def external_api(self) -> Optional["ExternalAPIClient"]:
+        """External API client, or None if it cannot be initialized."""
+        try:
+            from hmlr.core.external_api_client import ExternalAPIClient
+            from hmlr.core.rate_limiter import RateLimiter
+            # One limiter shared by Governor, Scribe, FactScrubber and main LLM
+            external_api = ExternalAPIClient(rate_limiter=RateLimiter(**self.rate_limits))
+            print(f"   🌐 External API client initialized")
+            return external_api
+        except Exception as e:
+            print(f"   ⚠️  Could not initialize External API Client: {e}")
+            return None
     
-    # Synthesis
-    synthesis_manager: SynthesisManager
-    user_profile_manager: UserProfileManager
-    scribe: Scribe
+    @cached_property
+    def governor(self) -> Optional["TheGovernor"]:
+        """The Governor (requires the external API)."""
+        from hmlr.memory.retrieval.lattice import TheGovernor
+        
+        governor = TheGovernor(self.external_api, self.storage, self.crawler) if self.external_api else None
+        if governor:
+            print(f"   🏛️  The Governor is online")
+        else:
+            print(f"   ⚠️  The Governor is offline (no API)")
+        return governor
+    
+    # === Synthesis System === #
+    
+    @cached_property
+    def synthesis_manager(self) -> "SynthesisManager":
+        """Daily/weekly synthesis manager."""
+        from hmlr.memory.synthesis import SynthesisManager
+        return SynthesisManager(self.storage)
+    
+    @cached_property
+    def user_profile_manager(self) -> "UserProfileManager":
+        """User profile manager (shared with the Scribe)."""
+        from hmlr.memory.synthesis.user_profile_manager import UserProfileManager
+        return UserProfileManager()
+    
+    @cached_property
+    def scribe(self) -> Optional["Scribe"]:
+        """The Scribe (requires the external API)."""
+        from hmlr.memory.synthesis.scribe import Scribe
+        
+        scribe = Scribe(self.external_api, self.user_profile_manager) if self.external_api else None
+        if scribe:
+            print(f"   ✍️  The Scribe is online")
+        else:
+            print(f"   ⚠️  The Scribe is offline (no API)")
+        return scribe
     
-    # Chunking and Fact Extraction
-    chunk_engine: ChunkEngine
-    fact_scrubber: Optional[FactScrubber]
+    # === Chunking and Fact Extraction === #
     
-    # Utilities
-    metadata_extractor: LLMMetadataExtractor
-    embedding_storage: EmbeddingStorage
+    @cached_property
+    def chunk_engine(self) -> "ChunkEngine":
+        """Hierarchical turn chunker."""
+        from hmlr.memory.chunking.chunk_engine import ChunkEngine
+        return ChunkEngine()
     
-    # Session state
-    previous_day: str
+    @cached_property
+    def fact_scrubber(self) -> Optional["FactScrubber"]:
+        """FactScrubber (requires the external API)."""
+        from hmlr.memory.fact_scrubber import FactScrubber
+        
+        fact_scrubber = FactScrubber(self.storage, self.external_api) if self.external_api else None
+        if fact_scrubber:
+            print(f"   🧹 FactScrubber is online")
+        else:
+            print(f"   ⚠️  FactScrubber is offline (no API)")
+        return fact_scrubber
 
 
 class ComponentFactory:
@@ -94,7 +187,11 @@ class ComponentFactory:
         use_llm_intent_mode: bool = False,
         max_sliding_window_turns: int = 20,
         context_budget_tokens: int = 6000,
-        crawler_recency_weight: float = 0.5
+        crawler_recency_weight: float = 0.5,
+        use_mmap: bool = True,
+        max_concurrent_requests: int = 8,
+        requests_per_minute: int = 500,
+        tokens_per_minute: int = 200000
     ) -> ComponentBundle:
         """
         Create and wire all CognitiveLattice components.
@@ -107,6 +204,11 @@ class ComponentFactory:
             max_sliding_window_turns: Max turns in sliding window (default: 20)
             context_budget_tokens: Token budget for context hydration (default: 6000)
             crawler_recency_weight: Weight for recent results (default: 0.5)
+            use_mmap: Memory-map the SQLite database file (default: True)
+            max_concurrent_requests: Max in-flight OpenAI requests (default: 8)
+            requests_per_minute: OpenAI request budget per minute (default: 500)
+            tokens_per_minute: OpenAI token budget per minute, estimated
+                               as prompt + max_tokens (default: 200000)
         
         Returns:
             ComponentBundle with all initialized components
@@ -121,6 +223,7 @@ class ComponentFactory:
         # Check for test database path override
         db_path = os.environ.get('COGNITIVE_LATTICE_DB')
         storage = Storage(db_path=db_path) if db_path else Storage()
+        storage.apply_perf_pragmas(use_mmap=use_mmap)
         conversation_mgr = ConversationManager(storage)
         previous_day = conversation_mgr.current_day
         
@@ -137,7 +240,11 @@ class ComponentFactory:
         # === Phase 3: Retrieval System === #
         print("   🔍 Initializing retrieval system...")
         intent_analyzer = IntentAnalyzer(use_llm_mode=use_llm_intent_mode)
-        crawler = LatticeCrawler(storage, recency_weight=crawler_recency_weight)
+        crawler = LatticeCrawler(
+            storage,
+            recency_weight=crawler_recency_weight,
+            embedding_storage=embedding_storage
+        )
         context_hydrator = ContextHydrator(storage=storage, max_tokens=context_budget_tokens)
         
         # === HMLR Components === #
@@ -153,7 +260,9 @@ class ComponentFactory:
             # No saved state - load from database
             print(f"      ℹ️  No saved state - loading from database...")
             try:
-                recent_turns = storage.get_recent_turns(day_id=None, limit=max_sliding_window_turns)
+                # Stream newest-first and stop after the window is full
+                recent_turns = list(islice(storage.iter_recent_turns(), max_sliding_window_turns))
+                recent_turns.reverse()
                 for turn in recent_turns:
                     sliding_window.add_turn(turn)
                 
@@ -169,45 +278,8 @@ class ComponentFactory:
         print(f"      - Intent Analyzer: {mode_desc}")
         print(f"      - Context Hydrator: {context_budget_tokens} token budget")
         
-        # === Synthesis System === #
-        print("   🧠 Initializing synthesis system...")
-        synthesis_manager = SynthesisManager(storage)
-        user_profile_manager = UserProfileManager()
-        print(f"   🧠 Synthesis system enabled")
-        
-        # === External Services === #
-        print("   🌐 Initializing external services...")
-        
-        try:
-            from hmlr.core.external_api_client import ExternalAPIClient
-            external_api = ExternalAPIClient()
-            print(f"   🌐 External API client initialized")
-        except Exception as e:
-            print(f"   ⚠️  Could not initialize External API Client: {e}")
-            external_api = None
-        
-        # Initialize Governor now that we have API client
-        governor = TheGovernor(external_api, storage, crawler) if external_api else None
-        if governor:
-            print(f"   🏛️  The Governor is online")
-        else:
-            print(f"   ⚠️  The Governor is offline (no API)")
-            
-        # Initialize Scribe now that we have API client
-        scribe = Scribe(external_api, user_profile_manager) if external_api else None
-        if scribe:
-            print(f"   ✍️  The Scribe is online")
-        else:
-            print(f"   ⚠️  The Scribe is offline (no API)")
-        
-        # === Chunking and Fact Extraction === #
-        print("   🔧 Initializing chunking and fact extraction...")
-        chunk_engine = ChunkEngine()
-        fact_scrubber = FactScrubber(storage, external_api) if external_api else None
-        if fact_scrubber:
-            print(f"   🧹 FactScrubber is online")
-        else:
-            print(f"   ⚠️  FactScrubber is offline (no API)")
+        # Synthesis, Governor, Scribe, FactScrubber and the external API
+        # client are created lazily by ComponentBundle on first access
         
         print("   ✅ All components initialized successfully")
         
@@ -220,16 +292,15 @@ class ComponentFactory:
             intent_analyzer=intent_analyzer,
             context_hydrator=context_hydrator,
             lattice_retrieval=lattice_retrieval,
-            governor=governor,
             hydrator=hydrator,
-            synthesis_manager=synthesis_manager,
-            user_profile_manager=user_profile_manager,
-            scribe=scribe,
-            chunk_engine=chunk_engine,
-            fact_scrubber=fact_scrubber,
             metadata_extractor=metadata_extractor,
             embedding_storage=embedding_storage,
-            previous_day=previous_day
+            previous_day=previous_day,
+            rate_limits={
+                "max_concurrent_requests": max_concurrent_requests,
+                "requests_per_minute": requests_per_minute,
+                "tokens_per_minute": tokens_per_minute
+            }
         )
     
     @staticmethod
@@ -267,7 +338,8 @@ class ComponentFactory:
             chunk_engine=components.chunk_engine,
             fact_scrubber=components.fact_scrubber,
             embedding_storage=components.embedding_storage,
-            previous_day=components.previous_day
+            previous_day=components.previous_day,
+            external_api=components.external_api
         )
         
         print("🚀 ConversationEngine initialized")
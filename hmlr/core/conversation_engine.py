@@ -19,6 +19,13 @@ from hmlr.memory.retrieval.hmlr_hydrator import Hydrator
 # LLMMetadataExtractor no longer needed - nano prompting handles metadata better
 
 
+class _NullDebugLogger:
+    """Stand-in when no debug logger is wired in; every log call is a no-op."""
+    
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
 class ConversationEngine:
     """
     Unified conversation processing engine for CognitiveLattice.
@@ -48,7 +55,9 @@ class ConversationEngine:
         chunk_engine,
         fact_scrubber,
         embedding_storage,
-        previous_day=None
+        previous_day=None,
+        external_api=None,
+        debug_logger=None
     ):
         """
         Initialize ConversationEngine with all required components.
@@ -71,6 +80,9 @@ class ConversationEngine:
             fact_scrubber: FactScrubber instance
             embedding_storage: EmbeddingStorage instance
             previous_day: Optional[str] ID of the previous day
+            external_api: ExternalAPIClient for the main LLM and metadata calls
+                          (shares the rate limiter with Governor/Scribe/FactScrubber)
+            debug_logger: Optional MemoryDebugLogger (no-op if omitted)
         """
         self.tracer = get_tracer(__name__)
         self.storage = storage
@@ -90,6 +102,8 @@ class ConversationEngine:
         self.fact_scrubber = fact_scrubber
         self.embedding_storage = embedding_storage
         self.previous_day = previous_day
+        self.external_api = external_api
+        self.debug_logger = debug_logger if debug_logger is not None else _NullDebugLogger()
         
         # HACK: Force chat intent for HMLR testing
         print("⚠️  HMLR TESTING MODE: Intent detection forced to 'chat' (except web automation)")
@@ -621,7 +635,13 @@ CRITICAL: User profile constraints with "Severity: strict" are IMMUTABLE and MUS
             
             # === MAIN LLM: Generate Response === #
             print(f"   🤖 Calling main LLM...")
-            chat_response = self.external_api.query_external_api(full_prompt)
+            # Run off the event loop so background Scribe/FactScrubber calls overlap
+            loop = asyncio.get_event_loop()
+            chat_response = await loop.run_in_executor(
+                None,
+                self.external_api.query_external_api,
+                full_prompt
+            )
             print(f"✅ Response received")
             
             # === PARSE METADATA JSON === #
@@ -645,30 +665,21 @@ CRITICAL: User profile constraints with "Severity: strict" are IMMUTABLE and MUS
                 except json.JSONDecodeError as e:
                     print(f"      ⚠️  Failed to parse metadata JSON: {e}")
             
-            # === UPDATE BRIDGE BLOCK HEADER === #
-            if metadata_json:
-                print(f"   💾 Updating Bridge Block header...")
-                try:
-                    # Update metadata in storage
-                    self.storage.update_bridge_block_metadata(block_id, metadata_json)
-                    print(f"      ✅ Header updated successfully")
-                except Exception as e:
-                    print(f"      ⚠️  Failed to update header: {e}")
-            
-            # === APPEND TURN TO BRIDGE BLOCK === #
-            print(f"   💾 Appending turn to Bridge Block...")
-            turn_data = {
-                "turn_id": turn_id,  # Reuse turn_id generated at start for chunking
-                "timestamp": datetime.now().isoformat(),
-                "user_message": user_query,
-                "ai_response": response_text
-            }
+            # Block header and turn append share one transaction
+            with self.storage.turn_transaction():
+                # === UPDATE BRIDGE BLOCK HEADER === #
+                if metadata_json:
+                    print(f"   💾 Updating Bridge Block header...")
+                    try:
+                        # Update metadata in storage
+                        self.storage.update_bridge_block_metadata(block_id, metadata_json)
+                        print(f"      ✅ Header updated successfully")
+                    except Exception as e:
+                        print(f"      ⚠️  Failed to update header: {e}")
             
-            try:
-                self.storage.append_turn_to_block(block_id, turn_data)
-                print(f"      ✅ Turn appended to block {block_id}")
-            except Exception as e:
-                print(f"      ⚠️  Failed to append turn: {e}")
+                # === APPEND TURN TO BRIDGE BLOCK === #
+                # Reuse turn_id generated at start for chunking
+                self._append_turn_to_block(block_id, turn_id, user_query, response_text)
             
             # === LOG AND RETURN === #
             print(f"\n💬 Response: {response_text[:200]}...")
@@ -731,6 +742,55 @@ CRITICAL: User profile constraints with "Severity: strict" are IMMUTABLE and MUS
                 error_traceback=error_trace
             )
     
+    def _append_turn_to_block(self, block_id: str, turn_id: str, user_query: str, response_text: str):
+        """
+        Append a Q/A pair to a Bridge Block's turn history.
+        
+        Args:
+            block_id: Bridge Block to append to
+            turn_id: Turn identifier
+            user_query: User's message
+            response_text: Assistant's response
+        """
+        print(f"   💾 Appending turn to Bridge Block...")
+        turn_data = {
+            "turn_id": turn_id,
+            "timestamp": datetime.now().isoformat(),
+            "user_message": user_query,
+            "ai_response": response_text
+        }
+        
+        try:
+            self.storage.append_turn_to_block(block_id, turn_data)
+            print(f"      ✅ Turn appended to block {block_id}")
+        except Exception as e:
+            print(f"      ⚠️  Failed to append turn: {e}")
+    
+    def log_cached_turn(self, user_msg: str, assistant_msg: str):
+        """
+        Record a turn answered from HMLRClient's semantic cache.
+        
+        The engine did not run, so this does the bookkeeping _handle_chat
+        would have done: append the Q/A pair to the active Bridge Block
+        (the history the hydrator gives the main LLM next turn), then log
+        it to storage, the sliding window and embeddings.
+        
+        Args:
+            user_msg: User's message
+            assistant_msg: Cached response text
+        """
+        active_block = next(
+            (block for block in self.storage.get_active_bridge_blocks()
+             if block.get('status') == 'ACTIVE'),
+            None
+        )
+        if active_block:
+            turn_id = f"turn_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            with self.storage.turn_transaction():
+                self._append_turn_to_block(active_block['block_id'], turn_id, user_msg, assistant_msg)
+        
+        self.log_conversation_turn(user_msg, assistant_msg)
+    
     def _build_context_metadata(self, preliminary_context) -> str:
         """
         Build metadata summary for intent diagnosis.
@@ -1349,55 +1409,59 @@ CRITICAL: User profile constraints with "Severity: strict" are IMMUTABLE and MUS
             else:
                 print(f"   😊 Detected affect: {affect}")
             
-            # Step 2: Create and log turn to storage
-            print(f"   💾 Logging turn to storage...")
-            turn = self.conversation_mgr.log_turn(
-                session_id=self.session_manager.lattice.session_id,
-                user_message=user_msg,
-                assistant_response=assistant_msg,
-                keywords=keywords,
-                active_topics=topics,
-                affect=affect
-            )
+            # Storage and embedding writes share one transaction (one WAL
+            # commit); the LLM calls for this turn have already finished
+            with self.storage.turn_transaction():
+                # Step 2: Create and log turn to storage
+                print(f"   💾 Logging turn to storage...")
+                turn = self.conversation_mgr.log_turn(
+                    session_id=self.session_manager.lattice.session_id,
+                    user_message=user_msg,
+                    assistant_response=assistant_msg,
+                    keywords=keywords,
+                    active_topics=topics,
+                    affect=affect
+                )
+            
+                # === HMLR v1: Add Turn to Active Span === #
+                # NOTE: Disabled for Phase 11.9 - using Bridge Blocks instead of Spans
+                # if hasattr(self, 'tabula_rasa'):
+                #     from datetime import datetime
+                #     active_span = self.tabula_rasa.storage.get_active_span()
+                #     if active_span:
+                #         if turn.turn_id not in active_span.turn_ids:
+                #             active_span.turn_ids.append(turn.turn_id)
+                #             active_span.last_active_at = datetime.now()
+                #             self.tabula_rasa.storage.update_span(active_span)
+                #             print(f"   🔗 Linked turn {turn.turn_id} to span {active_span.span_id}")
+            
+                # Step 3: Generate embeddings from keywords
+                if hasattr(turn, 'keywords') and turn.keywords:
+                    print(f"   🔍 Generating embeddings from {len(turn.keywords)} LLM-extracted keywords...")
+                
+                    # Filter out padding tokens
+                    valid_keywords = [kw for kw in turn.keywords if kw not in ['[PAD]', '', ' ']]
+                
+                    if valid_keywords:
+                        try:
+                            # Generate embeddings for each keyword
+                            self.embedding_storage.save_turn_embeddings(turn.turn_id, valid_keywords)
+                            print(f"   🔍 Generated {len(valid_keywords)} keyword embedding(s)")
+                        except Exception as e:
+                            print(f"   ⚠️ Could not generate embeddings: {e}")
+                    else:
+                        print(f"   ⚠️ No valid keywords to embed (all were padding)")
+                else:
+                    print(f"   ⚠️ No keywords available for embedding")
             
-            # Step 3: Add to sliding window
+            # Step 4: Add to sliding window (only once the turn is committed,
+            # so the window never holds a turn that was rolled back)
             print(f"   📋 Adding to sliding window...")
             self.sliding_window.add_turn(turn)
             self.sliding_window.save_to_file()
             
             print(f"   ✅ Turn logged: {turn.turn_id}")
             
-            # === HMLR v1: Add Turn to Active Span === #
-            # NOTE: Disabled for Phase 11.9 - using Bridge Blocks instead of Spans
-            # if hasattr(self, 'tabula_rasa'):
-            #     from datetime import datetime
-            #     active_span = self.tabula_rasa.storage.get_active_span()
-            #     if active_span:
-            #         if turn.turn_id not in active_span.turn_ids:
-            #             active_span.turn_ids.append(turn.turn_id)
-            #             active_span.last_active_at = datetime.now()
-            #             self.tabula_rasa.storage.update_span(active_span)
-            #             print(f"   🔗 Linked turn {turn.turn_id} to span {active_span.span_id}")
-            
-            # Step 4: Generate embeddings from keywords
-            if hasattr(turn, 'keywords') and turn.keywords:
-                print(f"   🔍 Generating embeddings from {len(turn.keywords)} LLM-extracted keywords...")
-                
-                # Filter out padding tokens
-                valid_keywords = [kw for kw in turn.keywords if kw not in ['[PAD]', '', ' ']]
-                
-                if valid_keywords:
-                    try:
-                        # Generate embeddings for each keyword
-                        self.embedding_storage.save_turn_embeddings(turn.turn_id, valid_keywords)
-                        print(f"   🔍 Generated {len(valid_keywords)} keyword embedding(s)")
-                    except Exception as e:
-                        print(f"   ⚠️ Could not generate embeddings: {e}")
-                else:
-                    print(f"   ⚠️ No valid keywords to embed (all were padding)")
-            else:
-                print(f"   ⚠️ No keywords available for embedding")
-            
             # Step 5: Check for day change and trigger synthesis
             current_day = self.conversation_mgr.current_day
             if current_day != self.previous_day:
@@ -0,0 +1,149 @@
+"""
+Content-Hash Embedding Cache
+
+Maps sha256(model, text) -> embedding so identical text (repeated user
+messages, recurring keywords, agent replays) is never re-encoded. Embeddings
+are stored as contiguous float32 byte strings and rebuilt with np.frombuffer
+on hit.
+
+`embedding_cache` is a process-wide instance shared by every HMLRClient, so
+a second client (LangChain chains, test harnesses, notebook reloads) reuses
+vectors the first one already computed.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    LRU + TTL cache of text embeddings keyed by SHA-256 of the text.
+
+    Bounded by both entry count and total vector bytes. Thread-safe, since
+    the shared instance is used from event-loop and executor threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_bytes: int = 64 * 1024 * 1024
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            max_entries: LRU capacity (default: 4096)
+            ttl_seconds: Entry lifetime in seconds (default: 7 days)
+            max_bytes: Cap on total cached vector bytes (default: 64MB)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        # digest -> (float32 bytes, created_at)
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, namespace: str = "") -> bytes:
+        """SHA-256 digest of the text (namespaced, e.g. by model name)."""
+        return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8")).digest()
+
+    def get(self, text: str, namespace: str = "") -> Optional[np.ndarray]:
+        """
+        Look up a cached embedding.
+
+        Args:
+            text: Text that was embedded
+            namespace: Embedding model name (keeps models' vectors apart)
+
+        Returns:
+            Read-only float32 array, or None on miss
+        """
+        digest = self.key(text, namespace)
+
+        with self._lock:
+            entry = self._entries.get(digest)
+
+            if entry is None or time.time() - entry[1] > self.ttl_seconds:
+                if entry is not None:
+                    self._drop(digest)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return np.frombuffer(entry[0], dtype=np.float32)
+
+    def put(self, text: str, embedding: np.ndarray, namespace: str = "") -> None:
+        """
+        Cache an embedding.
+
+        Args:
+            text: Text that was embedded
+            embedding: Embedding vector
+            namespace: Embedding model name (keeps models' vectors apart)
+        """
+        digest = self.key(text, namespace)
+        blob = np.ascontiguousarray(embedding, dtype=np.float32).tobytes()
+
+        with self._lock:
+            if digest in self._entries:
+                self._drop(digest)
+            self._entries[digest] = (blob, time.time())
+            self._bytes += len(blob)
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._drop(next(iter(self._entries)))
+
+    def attach(self, embedding_storage) -> None:
+        """
+        Make an EmbeddingStorage's encoder use this cache.
+
+        Args:
+            embedding_storage: EmbeddingStorage whose EmbeddingManager should share this cache
+        """
+        embedding_storage.embedding_manager.cache = self
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes of cached vectors."""
+        return self._bytes
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, digest: bytes) -> None:
+        """Remove one entry and release its bytes (caller holds the lock)."""
+        blob, _ = self._entries.pop(digest)
+        self._bytes -= len(blob)
+
+
+# Process-wide cache shared by all HMLRClient instances
+embedding_cache = EmbeddingCache()
@@ -11,6 +11,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import time
 from hmlr.core.telemetry import get_tracer
+from hmlr.core.rate_limiter import RateLimiter
 
 # Try to load environment variables, but don't fail if dotenv isn't available
 try:
@@ -76,11 +77,14 @@ Please provide a final, consolidated answer based on this data. The answer shoul
                 "temperature": 0.5,
             }
 
-            response = requests.post(
+            response = self._post(
                 f"{self.base_url}/chat/completions",
                 headers=headers,
                 json=payload,
-                timeout=120 # Increased timeout for potentially large summarization task
+                timeout=120, # Increased timeout for potentially large summarization task
+                estimated_tokens=RateLimiter.estimate_tokens(
+                    "".join(m["content"] for m in messages), payload["max_tokens"]
+                )
             )
 
             response.raise_for_status()
@@ -203,9 +207,11 @@ Now create the plan for: "{user_query}"
     Client for sending CognitiveLattice chunks to external APIs
     """
     
-    def __init__(self, api_provider="openai"):
+    def __init__(self, api_provider="openai", rate_limiter: Optional[RateLimiter] = None):
         self.tracer = get_tracer(__name__)
         self.api_provider = api_provider
+        # Shared limiter for all OpenAI calls (None = unthrottled)
+        self.rate_limiter = rate_limiter
         self.api_key = self._load_api_key()
         self.base_url = self._get_base_url()
         # Cache available models for this API key (used for graceful fallbacks)
@@ -523,6 +529,38 @@ Return analysis as structured JSON."""
         print(f"✅ Completed external analysis of {len(results)} chunks")
         return results
 
+    def _post(self, url: str, headers: Dict[str, str], json: Dict[str, Any], timeout: float,
+              estimated_tokens: int = 0, max_overload_retries: int = 3) -> requests.Response:
+        """
+        POST through the shared rate limiter.
+        
+        Waits for a request slot before sending. On 429 the limiter backs off
+        (halved concurrency + Retry-After pause) and the request is retried,
+        up to max_overload_retries times; the last response is returned as-is.
+        """
+        if self.rate_limiter is None:
+            return requests.post(url, headers=headers, json=json, timeout=timeout)
+        
+        for attempt in range(max_overload_retries + 1):
+            resp = None
+            self.rate_limiter.acquire(estimated_tokens)
+            try:
+                resp = requests.post(url, headers=headers, json=json, timeout=timeout)
+            finally:
+                self.rate_limiter.release(success=resp is not None and resp.status_code != 429)
+            
+            if resp.status_code != 429 or attempt == max_overload_retries:
+                return resp
+            
+            try:
+                retry_after = float(resp.headers.get("Retry-After", 0))
+            except (TypeError, ValueError):
+                retry_after = None
+            print(f"⏳ Rate limited (429), backing off (attempt {attempt + 1}/{max_overload_retries})")
+            self.rate_limiter.record_overload(retry_after)
+        
+        return resp
+    
     def _call_openai_api(self, model: str, messages: List[Dict[str, Any]], max_tokens: int, temperature: float) -> Dict[str, Any]:
         """Make API call to OpenAI with specified model and parameters"""
         
@@ -546,15 +584,21 @@ Return analysis as structured JSON."""
                 "max_tokens": max_tokens,
                 "temperature": temperature,
             }
+            
+            estimated_tokens = RateLimiter.estimate_tokens(
+                "".join(str(m.get('content', '')) for m in messages if isinstance(m, dict)),
+                max_tokens
+            )
 
             # Try chat/completions first (most common). If provider returns an error
             # indicating the model requires a different endpoint, fall back to /responses.
             try:
-                resp = requests.post(
+                resp = self._post(
                     f"{self.base_url}/chat/completions",
                     headers=headers,
                     json=payload,
-                    timeout=60
+                    timeout=60,
+                    estimated_tokens=estimated_tokens
                 )
                 if resp.status_code in (400, 404):
                     # Try to surface helpful body
@@ -610,11 +654,12 @@ Return analysis as structured JSON."""
                             adjusted['max_completion_tokens'] = adjusted.pop('max_tokens')
                         print("🔁 Retrying chat/completions with 'max_completion_tokens' instead of 'max_tokens'")
                         try:
-                            resp_retry = requests.post(
+                            resp_retry = self._post(
                                 f"{self.base_url}/chat/completions",
                                 headers=headers,
                                 json=adjusted,
-                                timeout=60
+                                timeout=60,
+                                estimated_tokens=estimated_tokens
                             )
                             resp_retry.raise_for_status()
                             result = resp_retry.json()
@@ -647,11 +692,12 @@ Return analysis as structured JSON."""
                     backoff = 1.0
                     for attempt in range(1, max_retries + 1):
                         try:
-                            resp2 = requests.post(
+                            resp2 = self._post(
                                 f"{self.base_url}/responses",
                                 headers=headers,
                                 json=resp2_payload,
-                                timeout=120
+                                timeout=120,
+                                estimated_tokens=estimated_tokens
                             )
                             # Surface 4xx bodies for debugging
                             if resp2.status_code in (400, 404):
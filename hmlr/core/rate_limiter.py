@@ -0,0 +1,146 @@
+"""
+Preemptive Rate Limiter for OpenAI Calls
+
+Shared by every ExternalAPIClient call made during a turn (Governor routing,
+memory filter, FactScrubber, Scribe, main LLM). Requests wait for a slot
+BEFORE they are sent, so bursts stay under the account's request and token
+budgets instead of bouncing off 429s.
+
+Concurrency adapts to overload (AIMD): every 429 halves the number of
+in-flight requests and pauses new ones for the server's Retry-After, and
+every success grows the limit back by roughly one request per window.
+Calls run on executor threads, so all state is guarded by a Condition.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Thread-safe RPM/TPM limiter with adaptive max concurrency.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = 8,
+        requests_per_minute: int = 500,
+        tokens_per_minute: int = 200000,
+        min_concurrent_requests: int = 1
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_concurrent_requests: Upper bound on in-flight requests
+            requests_per_minute: Request budget per rolling minute
+            tokens_per_minute: Token budget per rolling minute (estimated)
+            min_concurrent_requests: Floor for adaptive concurrency
+        """
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.min_concurrent_requests = min_concurrent_requests
+
+        self.concurrency_limit = float(max_concurrent_requests)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._window = deque()  # (sent_at, estimated_tokens)
+        self._window_tokens = 0
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def estimate_tokens(text: str, max_tokens: int = 0) -> int:
+        """Rough prompt + completion token estimate (~4 chars per token)."""
+        return len(text) // 4 + max_tokens
+
+    @contextmanager
+    def request(self, estimated_tokens: int = 0):
+        """
+        Hold a request slot for the duration of one API call.
+
+        Args:
+            estimated_tokens: Estimated prompt + completion tokens
+        """
+        self.acquire(estimated_tokens)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self, estimated_tokens: int = 0) -> None:
+        """Block until concurrency, request and token budgets allow a call."""
+        # A single oversized request must still be allowed through eventually
+        estimated_tokens = min(estimated_tokens, self.tokens_per_minute)
+
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+
+                wait = self._wait_time(now, estimated_tokens)
+                if wait <= 0:
+                    break
+                self._cond.wait(timeout=wait)
+
+            self._in_flight += 1
+            self._window.append((now, estimated_tokens))
+            self._window_tokens += estimated_tokens
+
+    def release(self, success: bool = True) -> None:
+        """
+        Free a request slot.
+
+        Args:
+            success: Whether the call succeeded (grows concurrency back)
+        """
+        with self._cond:
+            self._in_flight -= 1
+            if success and self.concurrency_limit < self.max_concurrent_requests:
+                self.concurrency_limit = min(
+                    float(self.max_concurrent_requests),
+                    self.concurrency_limit + 1.0 / self.concurrency_limit
+                )
+            self._cond.notify_all()
+
+    def record_overload(self, retry_after: Optional[float] = None) -> None:
+        """
+        React to a 429: halve concurrency and pause new requests.
+
+        Args:
+            retry_after: Seconds from the Retry-After header (default: 1s)
+        """
+        with self._cond:
+            self.concurrency_limit = max(
+                float(self.min_concurrent_requests),
+                self.concurrency_limit / 2
+            )
+            pause = retry_after if retry_after and retry_after > 0 else 1.0
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self._cond.notify_all()
+
+    def _expire(self, now: float) -> None:
+        """Drop requests that left the rolling window."""
+        while self._window and now - self._window[0][0] >= self.WINDOW_SECONDS:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+
+    def _wait_time(self, now: float, estimated_tokens: int) -> float:
+        """Seconds until a request could be admitted (0 if it can go now)."""
+        if now < self._paused_until:
+            return self._paused_until - now
+
+        if self._in_flight >= max(1, int(self.concurrency_limit)):
+            return self.WINDOW_SECONDS  # woken by release()
+
+        over_rpm = len(self._window) >= self.requests_per_minute
+        over_tpm = self._window_tokens + estimated_tokens > self.tokens_per_minute
+        if (over_rpm or over_tpm) and self._window:
+            return self._window[0][0] + self.WINDOW_SECONDS - now
+
+        return 0.0
@@ -0,0 +1,172 @@
+"""
+Semantic Query Cache for HMLRClient
+
+Short-circuits near-duplicate user questions ("What's my name?" vs
+"what is my name") by matching the query embedding against recently
+answered queries. A hit returns the cached response without running the
+ConversationEngine (no Governor, Scribe or main LLM calls).
+
+Following MeanCache, each entry also records its conversational context
+(the embeddings of the last few user messages), and a hit requires every
+context turn to match as well. This keeps follow-up questions like "and
+what about tomorrow?" from being answered out of an unrelated conversation.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    LRU + TTL cache of (query embedding, context embeddings) -> response.
+
+    Lookups are a single matrix-vector product against the stacked,
+    L2-normalized query embeddings of all live entries.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 512
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit (query and context)
+            ttl_seconds: Entry lifetime in seconds (default: 7 days)
+            max_entries: LRU capacity
+        """
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        # key -> (query_vec, context tuple, response, created_at)
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._next_key = 0
+
+        # Stacked query matrix, rebuilt lazily after inserts/evictions
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_keys: list = []
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(vector) -> np.ndarray:
+        """Return a float32, L2-normalized copy of an embedding."""
+        vec = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    def lookup(
+        self,
+        query_vec: np.ndarray,
+        context: Sequence[np.ndarray] = ()
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached response for a normalized query embedding.
+
+        Args:
+            query_vec: L2-normalized query embedding
+            context: L2-normalized embeddings of the preceding user
+                     messages, oldest first (empty at conversation start)
+
+        Returns:
+            Cached response dict, or None on miss
+        """
+        self._evict_expired()
+
+        if not self._entries:
+            self.misses += 1
+            return None
+
+        if self._matrix is None:
+            self._rebuild_matrix()
+
+        scores = self._matrix @ query_vec
+
+        # Walk candidates above threshold, best first, until context matches
+        for idx in np.argsort(-scores):
+            if scores[idx] < self.threshold:
+                break
+
+            key = self._matrix_keys[idx]
+            _, cached_context, response, _ = self._entries[key]
+
+            if not self._context_matches(cached_context, context):
+                continue
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+        self.misses += 1
+        return None
+
+    def store(
+        self,
+        query_vec: np.ndarray,
+        response: Dict[str, Any],
+        context: Sequence[np.ndarray] = ()
+    ) -> None:
+        """
+        Cache a response for a normalized query embedding.
+
+        Args:
+            query_vec: L2-normalized query embedding
+            response: Response dict returned by HMLRClient.chat
+            context: L2-normalized embeddings of the preceding user
+                     messages, oldest first
+        """
+        self._entries[self._next_key] = (query_vec, tuple(context), response, time.time())
+        self._next_key += 1
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        self._matrix = None
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self._matrix = None
+        self._matrix_keys = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _context_matches(
+        self,
+        cached: Tuple[np.ndarray, ...],
+        current: Sequence[np.ndarray]
+    ) -> bool:
+        """Same number of context turns, each pair similar enough."""
+        if len(cached) != len(current):
+            return False
+        return all(
+            float(old @ new) >= self.threshold
+            for old, new in zip(cached, current)
+        )
+
+    def _evict_expired(self) -> None:
+        """Drop entries older than the TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        expired = [key for key, entry in self._entries.items() if entry[3] < cutoff]
+
+        for key in expired:
+            del self._entries[key]
+
+        if expired:
+            self._matrix = None
+
+    def _rebuild_matrix(self) -> None:
+        """Stack live query embeddings into a contiguous (N, d) float32 matrix."""
+        self._matrix_keys = list(self._entries.keys())
+        self._matrix = np.stack(
+            [self._entries[key][0] for key in self._matrix_keys]
+        ).astype(np.float32, copy=False)
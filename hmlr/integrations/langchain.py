@@ -24,14 +24,17 @@ Example:
 try:
     from langchain.memory import BaseMemory
     from langchain.schema import BaseMessage, HumanMessage, AIMessage
+    from pydantic import PrivateAttr
 except ImportError:
     raise ImportError(
         "LangChain integration requires langchain to be installed.\n"
         "Install with: pip install hmlr[langchain]"
     )
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import asyncio
+import sys
+import threading
 from ..client import HMLRClient
 
 
@@ -42,16 +45,34 @@ class HMLRMemory(BaseMemory):
     This adapter allows HMLR to be used as a LangChain memory backend.
     Note that HMLR handles context retrieval internally, so this adapter
     primarily saves conversations to HMLR's storage.
+    
+    HMLR's async chat runs on one event loop owned by the adapter (on a
+    daemon thread), so save_context works from sync callbacks and from
+    inside an already-running async chain alike.
+    
+    save_context only enqueues the turn and returns; a single consumer
+    task on that loop feeds queued turns to HMLR in order. Call flush()
+    to wait for pending saves, and close() (or use the memory as a
+    context manager) to save them and shut down cleanly.
     """
     
     hmlr_client: HMLRClient
     memory_key: str = "history"
+    save_timeout: Optional[float] = 120.0
+    max_pending_saves: int = 64
+    
+    _loop: Any = PrivateAttr(default=None)
+    _loop_thread: Any = PrivateAttr(default=None)
+    _write_queue: Any = PrivateAttr(default=None)
+    _consumer: Any = PrivateAttr(default=None)
     
     def __init__(
         self,
         api_key: str,
         db_path: str = "hmlr_memory.db",
         model: str = "gpt-4.1-mini",
+        save_timeout: Optional[float] = 120.0,
+        max_pending_saves: int = 64,
         **kwargs
     ):
         """
@@ -61,15 +82,93 @@ class HMLRMemory(BaseMemory):
             api_key: OpenAI API key
             db_path: Path to HMLR database
             model: Model to use (default: gpt-4.1-mini)
+            save_timeout: Seconds flush() waits for pending saves (None waits forever)
+            max_pending_saves: Queue bound; the oldest unsaved turn is dropped beyond it
             **kwargs: Additional HMLR client options
         """
-        super().__init__()
-        self.hmlr_client = HMLRClient(
-            api_key=api_key,
-            db_path=db_path,
-            model=model,
-            **kwargs
+        super().__init__(
+            hmlr_client=HMLRClient(
+                api_key=api_key,
+                db_path=db_path,
+                model=model,
+                **kwargs
+            ),
+            save_timeout=save_timeout,
+            max_pending_saves=max_pending_saves
         )
+        
+        # Persistent loop for HMLR coroutines (and their background tasks)
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._run_loop,
+            args=(self._loop,),
+            name="hmlr-memory-loop",
+            daemon=True
+        )
+        self._loop_thread.start()
+        
+        # Write queue and its consumer must be created on the loop itself
+        asyncio.run_coroutine_threadsafe(self._start_consumer(), self._loop).result()
+    
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """Run the loop until stopped, then close it (loop thread target)."""
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+    
+    async def _start_consumer(self) -> None:
+        """Create the write queue and start the consumer task (runs on the loop)."""
+        self._write_queue = asyncio.Queue(maxsize=self.max_pending_saves)
+        self._consumer = asyncio.ensure_future(
+            self._consume_writes(self._write_queue, self.hmlr_client)
+        )
+    
+    @staticmethod
+    async def _consume_writes(write_queue: asyncio.Queue, hmlr_client: HMLRClient) -> None:
+        """
+        Feed queued user messages to HMLR one at a time, in order.
+        
+        Takes the queue and client rather than self so the running task
+        does not keep the memory object alive (and __del__ can run).
+        """
+        while True:
+            user_message = await write_queue.get()
+            try:
+                # Process through HMLR (automatically stores the turn)
+                await hmlr_client.chat(user_message)
+            except Exception as e:
+                # Log error but keep consuming
+                print(f"⚠️  HMLR memory save failed: {e}")
+            finally:
+                write_queue.task_done()
+    
+    @staticmethod
+    async def _stop_consumer(consumer: Optional[asyncio.Task]) -> None:
+        """Cancel the consumer task and wait for it to finish (runs on the loop)."""
+        if consumer is not None:
+            consumer.cancel()
+            try:
+                await consumer
+            except asyncio.CancelledError:
+                pass
+    
+    @staticmethod
+    async def _shutdown(consumer: Optional[asyncio.Task], hmlr_client: HMLRClient) -> None:
+        """Stop the consumer, then close the client and stop the loop (runs on the loop)."""
+        await HMLRMemory._stop_consumer(consumer)
+        hmlr_client.close()
+        asyncio.get_running_loop().stop()
+    
+    @staticmethod
+    def _enqueue(write_queue: asyncio.Queue, user_message: str) -> None:
+        """Queue a message, dropping the oldest one when full (runs on the loop)."""
+        if write_queue.full():
+            write_queue.get_nowait()
+            write_queue.task_done()
+            print("⚠️  HMLR save queue full - dropped oldest unsaved turn")
+        write_queue.put_nowait(user_message)
     
     @property
     def memory_variables(self) -> List[str]:
@@ -107,14 +206,26 @@ class HMLRMemory(BaseMemory):
         if not user_message:
             return
         
-        # Process through HMLR (automatically stores the turn)
+        # Hand off to the consumer and return without waiting for HMLR
+        self._loop.call_soon_threadsafe(self._enqueue, self._write_queue, user_message)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued turn has been saved.
+        
+        Args:
+            timeout: Seconds to wait (default: save_timeout)
+        
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        future = asyncio.run_coroutine_threadsafe(self._write_queue.join(), self._loop)
         try:
-            asyncio.run(
-                self.hmlr_client.chat(user_message)
-            )
-        except Exception as e:
-            # Log error but don't crash the chain
-            print(f"⚠️  HMLR memory save failed: {e}")
+            future.result(timeout=timeout if timeout is not None else self.save_timeout)
+            return True
+        except Exception:
+            future.cancel()
+            return False
     
     def clear(self) -> None:
         """
@@ -133,7 +244,59 @@ class HMLRMemory(BaseMemory):
         )
         self.hmlr_client.clear_sliding_window()
     
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Save pending turns, then shut down the event loop and the HMLR client.
+        
+        Safe to call more than once. Must not be called from a coroutine
+        running on the adapter's own loop.
+        
+        Args:
+            timeout: Seconds to wait for pending saves (default: save_timeout)
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        if threading.current_thread() is self._loop_thread:
+            raise RuntimeError("HMLRMemory.close() cannot run on HMLR's own event loop")
+        
+        if not self.flush(timeout):
+            print("⚠️  HMLR memory closed with unsaved turns")
+        
+        # The client is closed only once the consumer has stopped using it
+        asyncio.run_coroutine_threadsafe(self._stop_consumer(self._consumer), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._loop_thread.join()
+        self.hmlr_client.close()
+    
+    def __enter__(self):
+        """Support context manager protocol."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Support context manager protocol."""
+        self.close()
+        return False
+    
     def __del__(self):
-        """Cleanup when object is destroyed."""
-        if hasattr(self, 'hmlr_client'):
+        """
+        Shut down without blocking the garbage collector.
+        
+        Queued turns that have not been saved yet are dropped; call close()
+        or flush() first to keep them.
+        """
+        loop = getattr(self, '_loop', None)
+        if loop is None or loop.is_closed():
+            return
+        
+        # At interpreter shutdown the loop thread is frozen; close directly
+        if sys.is_finalizing():
             self.hmlr_client.close()
+            return
+        
+        write_queue = getattr(self, '_write_queue', None)
+        if write_queue is not None and write_queue.qsize():
+            print("⚠️  HMLR memory closed with unsaved turns")
+        asyncio.run_coroutine_threadsafe(
+            self._shutdown(self._consumer, self.hmlr_client), loop
+        )
@@ -269,11 +269,11 @@ Return ONLY valid JSON, no other text."""
                 block.embedded_at.isoformat() if block.embedded_at else None
             ))
             
-            conn.commit()
+            self.storage.commit()
             logger.info(f"Saved Bridge Block {block.block_id} to daily_ledger")
         
         except Exception as e:
-            conn.rollback()
+            self.storage.rollback()
             logger.error(f"Failed to save Bridge Block {block.block_id}: {e}")
             raise
     
@@ -64,11 +64,11 @@ class ChunkStorage:
                     json.dumps(chunk.metadata)
                 ))
             
-            self.conn.commit()
+            self.storage.commit()
             logger.info(f"Saved {len(chunks)} chunks to database")
         
         except Exception as e:
-            self.conn.rollback()
+            self.storage.rollback()
             logger.error(f"Failed to save chunks: {e}")
             raise
     
@@ -216,7 +216,7 @@ class ChunkStorage:
             WHERE chunk_id = ?
         """, (block_id, chunk_id))
         
-        self.conn.commit()
+        self.storage.commit()
     
     def get_child_chunks(self, parent_chunk_id: str) -> List[Chunk]:
         """
@@ -10,6 +10,8 @@ from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import pickle
 
+from hmlr.core.embedding_cache import EmbeddingCache
+
 try:
     from sentence_transformers import SentenceTransformer
     SENTENCE_TRANSFORMERS_AVAILABLE = True
@@ -23,15 +25,17 @@ class EmbeddingManager:
     Manages vector embeddings for conversation turns.
     """
     
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', cache: Optional[EmbeddingCache] = None):
         """
         Initialize embedding manager.
         
         Args:
             model_name: SentenceTransformer model name
+            cache: Optional EmbeddingCache (a private one is created if omitted)
         """
         self.model_name = model_name
         self.dimension = 384  # all-MiniLM-L6-v2 output dimension
+        self.cache = cache if cache is not None else EmbeddingCache()
         
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             raise ImportError(
@@ -54,17 +58,55 @@ class EmbeddingManager:
         """
         return self.model.encode(text, show_progress_bar=False)
     
-    def encode_batch(self, texts: List[str]) -> np.ndarray:
+    def encode_cached(self, text: str) -> np.ndarray:
+        """
+        Generate embedding for text, reusing the cached vector for repeat text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            Numpy array of shape (384,)
+        """
+        embedding = self.cache.get(text, self.model_name)
+        if embedding is None:
+            embedding = self.encode(text)
+            self.cache.put(text, embedding, self.model_name)
+        return embedding
+    
+    def encode_batch_cached(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts, encoding only cache misses.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            Numpy array of shape (N, 384)
+        """
+        embeddings = [self.cache.get(text, self.model_name) for text in texts]
+        missing = [i for i, emb in enumerate(embeddings) if emb is None]
+        
+        if missing:
+            encoded = self.encode_batch([texts[i] for i in missing], show_progress_bar=False)
+            for i, embedding in zip(missing, encoded):
+                self.cache.put(texts[i], embedding, self.model_name)
+                embeddings[i] = embedding
+        
+        return np.stack(embeddings).astype(np.float32, copy=False)
+    
+    def encode_batch(self, texts: List[str], show_progress_bar: bool = True) -> np.ndarray:
         """
         Generate embeddings for multiple texts (faster).
         
         Args:
             texts: List of texts to embed
+            show_progress_bar: Display encoding progress (default: True)
             
         Returns:
             Numpy array of shape (N, 384)
         """
-        return self.model.encode(texts, show_progress_bar=True, batch_size=32)
+        return self.model.encode(texts, show_progress_bar=show_progress_bar, batch_size=32)
     
     def cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
@@ -86,28 +128,145 @@ class EmbeddingManager:
         
         return float(dot_product / (norm1 * norm2))
     
+    @staticmethod
+    def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize each row so cosine similarity reduces to a dot product.
+        
+        Args:
+            matrix: Array of shape (N, d)
+            
+        Returns:
+            float32 array of shape (N, d); all-zero rows stay zero
+        """
+        matrix = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+    
+    @staticmethod
+    def score_rows(matrix: np.ndarray, query: np.ndarray, block_rows: int = 1024) -> np.ndarray:
+        """
+        Dot every row of a (possibly FP16) matrix with a query vector.
+        
+        FP16 matrices stay FP16 in memory: rows are widened to FP32 one
+        cache-sized block at a time into a reused buffer, instead of
+        materializing a full FP32 copy of the matrix for every query
+        (NumPy has no FP16 BLAS path).
+        
+        Args:
+            matrix: float16/float32 array of shape (N, d)
+            query: float32 vector of shape (d,)
+            block_rows: Rows widened per block (1024 x 384 FP32 = 1.5MB)
+            
+        Returns:
+            float32 array of shape (N,)
+        """
+        query = np.asarray(query, dtype=np.float32)
+        if matrix.dtype == np.float32:
+            return matrix @ query
+        
+        n_rows = len(matrix)
+        scores = np.empty(n_rows, dtype=np.float32)
+        buffer = np.empty((min(block_rows, n_rows), matrix.shape[1]), dtype=np.float32)
+        
+        for start in range(0, n_rows, block_rows):
+            block = matrix[start:start + block_rows]
+            widened = buffer[:len(block)]
+            widened[...] = block
+            np.dot(widened, query, out=scores[start:start + len(block)])
+        
+        return scores
+    
+    def top_k_similar(self, query_embedding: np.ndarray, normalized_matrix: np.ndarray,
+                      top_k: int = 10, min_similarity: float = 0.0) -> List[Tuple[int, float]]:
+        """
+        Rank rows of a pre-normalized matrix by cosine similarity to the query.
+        
+        One matrix-vector product scores every row; argpartition then picks
+        the top-k without sorting the whole array. FP16 matrices are scored
+        block by block (see score_rows).
+        
+        Args:
+            query_embedding: Query vector
+            normalized_matrix: Row-normalized float32/float16 array of shape (N, d)
+            top_k: Number of results to return
+            min_similarity: Minimum similarity threshold (0-1)
+            
+        Returns:
+            List of (row_index, similarity) tuples, most similar first
+        """
+        if len(normalized_matrix) == 0 or top_k <= 0:
+            return []
+        
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return []
+        
+        scores = self.score_rows(normalized_matrix, query / query_norm)
+        
+        if top_k < len(scores):
+            candidates = np.argpartition(-scores, top_k)[:top_k]
+        else:
+            candidates = np.arange(len(scores))
+        candidates = candidates[np.argsort(-scores[candidates])]
+        
+        return [(int(i), float(scores[i])) for i in candidates if scores[i] >= min_similarity]
+    
+    @staticmethod
+    def fit_pca(matrix: np.ndarray, n_components: int, max_samples: int = 4096,
+                seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fit a PCA projection on (a sample of) embedding rows via SVD.
+        
+        Args:
+            matrix: Array of shape (N, d)
+            n_components: Reduced dimension (clipped to min(N, d))
+            max_samples: Rows sampled for the fit
+            seed: Sampling seed (fits are reproducible)
+            
+        Returns:
+            (components, mean): float32 arrays of shape (n_components, d) and (d,)
+        """
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if len(matrix) > max_samples:
+            rows = np.random.default_rng(seed).choice(len(matrix), max_samples, replace=False)
+            matrix = matrix[rows]
+        
+        mean = matrix.mean(axis=0)
+        _, _, vt = np.linalg.svd(matrix - mean, full_matrices=False)
+        return np.ascontiguousarray(vt[:n_components], dtype=np.float32), mean.astype(np.float32)
+    
     def serialize_embedding(self, embedding: np.ndarray) -> bytes:
         """
         Serialize embedding to bytes for database storage.
         
+        Stored as raw FP16 (2 bytes/dim): half the size of FP32 with
+        negligible effect on cosine ranking.
+        
         Args:
             embedding: Numpy array
             
         Returns:
-            Pickled bytes
+            Raw float16 bytes
         """
-        return pickle.dumps(embedding)
+        return np.asarray(embedding, dtype=np.float16).tobytes()
     
     def deserialize_embedding(self, data: bytes) -> np.ndarray:
         """
         Deserialize embedding from database bytes.
         
+        Accepts raw FP16 blobs and legacy pickled arrays (a pickled
+        vector is always longer than dimension * 2 bytes).
+        
         Args:
-            data: Pickled bytes
+            data: Raw float16 bytes or pickled bytes
             
         Returns:
-            Numpy array
+            Numpy array (float16 for raw blobs)
         """
+        if len(data) == self.dimension * 2:
+            return np.frombuffer(data, dtype=np.float16)
         return pickle.loads(data)
     
     def find_similar(self, query_embedding: np.ndarray, 
@@ -126,23 +285,20 @@ class EmbeddingManager:
         Returns:
             List of dicts with embedding_id, similarity, text
         """
-        results = []
-        
-        for embedding_id, stored_vec, text in stored_embeddings:
-            similarity = self.cosine_similarity(query_embedding, stored_vec)
-            
-            if similarity >= min_similarity:
-                results.append({
-                    'embedding_id': embedding_id,
-                    'similarity': similarity,
-                    'text': text,
-                    'vector': stored_vec  # Include vector for visualization
-                })
-        
-        # Sort by similarity descending
-        results.sort(key=lambda x: x['similarity'], reverse=True)
-        
-        return results[:top_k]
+        if not stored_embeddings:
+            return []
+        
+        matrix = self.normalize_rows(np.stack([vec for _, vec, _ in stored_embeddings]))
+        
+        return [
+            {
+                'embedding_id': stored_embeddings[i][0],
+                'similarity': similarity,
+                'text': stored_embeddings[i][2],
+                'vector': stored_embeddings[i][1]  # Include vector for visualization
+            }
+            for i, similarity in self.top_k_similar(query_embedding, matrix, top_k, min_similarity)
+        ]
 
 
 class EmbeddingStorage:
@@ -151,6 +307,14 @@ class EmbeddingStorage:
     Works with Storage class from storage.py
     """
     
+    # Two-stage brute-force search: score all rows in a PCA-reduced space,
+    # then rerank the best candidates with the full FP16 vectors
+    PCA_COMPONENTS = 64        # 384 -> 64 dims: 6x less data on the first pass
+    PCA_MIN_ROWS = 10000       # Below this a single full scan is already cheap
+    PCA_RERANK_FACTOR = 4      # Rerank top (factor * k) candidates...
+    PCA_MIN_CANDIDATES = 256   # ...but never fewer than this
+    PCA_FIT_SAMPLES = 4096     # Rows sampled to fit the projection
+    
     def __init__(self, storage):
         """
         Initialize with storage instance.
@@ -160,11 +324,94 @@ class EmbeddingStorage:
         """
         self.storage = storage
         self.embedding_manager = EmbeddingManager()
+        
+        # In-memory FP16 search matrix for the brute-force path (rows
+        # L2-normalized), rebuilt only when the underlying tables change
+        self._search_signature = None
+        self._search_matrix = np.empty((0, self.embedding_manager.dimension), dtype=np.float16)
+        self._search_rows: List[Tuple[str, str, str]] = []  # (embedding_id, text, turn_id)
+        
+        # PCA-projected copy of the search matrix for the first-pass scan
+        # on large memories (see _pca_candidates); None below PCA_MIN_ROWS
+        self._pca: Optional[Tuple[np.ndarray, np.ndarray]] = None  # (components, mean)
+        self._search_matrix_pca: Optional[np.ndarray] = None
+        
+        self._migrate_legacy_embeddings()
+        self._sync_vec_index()
+    
+    def _migrate_legacy_embeddings(self):
+        """
+        Rewrite pickled FP32 embeddings as raw FP16 blobs (one-time).
+        
+        Rows are updated in place, so rowids (and the sqlite-vec index)
+        are unaffected.
+        """
+        cursor = self.storage.conn.cursor()
+        rows = cursor.execute("""
+            SELECT rowid, embedding FROM embeddings
+            WHERE length(embedding) != ?
+        """, (self.embedding_manager.dimension * 2,)).fetchall()
+        
+        updates = []
+        for rowid, blob in rows:
+            try:
+                vector = np.asarray(pickle.loads(blob)).ravel()
+            except Exception:
+                continue
+            if len(vector) == self.embedding_manager.dimension:
+                updates.append((self.embedding_manager.serialize_embedding(vector), rowid))
+        
+        if updates:
+            print(f"   🔄 Migrating {len(updates)} embeddings to FP16 storage...")
+            cursor.executemany("UPDATE embeddings SET embedding = ? WHERE rowid = ?", updates)
+            self.storage.commit()
+    
+    def _sync_vec_index(self):
+        """
+        Backfill the sqlite-vec index from the embeddings table.
+        
+        Runs when the index and the table disagree (first run with sqlite-vec
+        installed, embeddings written without the extension loaded, or an
+        orphaned index entry left by an unindexed replace).
+        """
+        if not getattr(self.storage, 'has_vec0', False):
+            return
+        if self.storage.get_vec_index_mismatch_count() == 0:
+            return
+        
+        print("   🔄 Rebuilding sqlite-vec index from stored embeddings...")
+        self.storage.clear_vec_index()
+        
+        embedding_ids, vectors = [], []
+        for embedding_id, vector, _, _ in self.get_all_embeddings():
+            if len(vector) == self.embedding_manager.dimension:
+                embedding_ids.append(embedding_id)
+                vectors.append(np.asarray(vector, dtype=np.float32).tobytes())
+        
+        self.storage.index_embedding_vectors(embedding_ids, vectors)
+        self.storage.commit()
+    
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed several texts in a single model call (cached texts are skipped).
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            Numpy array of shape (N, dimension)
+        """
+        if not texts:
+            return np.empty((0, self.embedding_manager.dimension), dtype=np.float32)
+        return self.embedding_manager.encode_batch_cached(texts)
     
     def save_turn_embeddings(self, turn_id: str, chunks: List[str]) -> int:
         """
         Generate and save embeddings for turn chunks.
         
+        All chunks are encoded in one batched call and written with a
+        single executemany.
+        
         Args:
             turn_id: Turn identifier
             chunks: List of text chunks
@@ -172,34 +419,41 @@ class EmbeddingStorage:
         Returns:
             Number of embeddings saved
         """
-        cursor = self.storage.conn.cursor()
+        embeddings = self.embed_batch(chunks)
+        embedding_ids = [f"{turn_id}_chunk_{idx}" for idx in range(len(chunks))]
         
-        for idx, chunk_text in enumerate(chunks):
-            # Generate embedding
-            embedding = self.embedding_manager.encode(chunk_text)
-            
-            # Serialize for storage
-            embedding_bytes = self.embedding_manager.serialize_embedding(embedding)
-            
-            # Generate embedding ID
-            embedding_id = f"{turn_id}_chunk_{idx}"
-            
-            # Store in database
-            cursor.execute("""
-                INSERT OR REPLACE INTO embeddings 
-                (embedding_id, turn_id, chunk_index, embedding, text_content, dimension, model_name)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                embedding_id,
+        # Only worth checking if the brute-force search matrix is loaded
+        signature_before = self._table_signature() if self._search_signature is not None else None
+        
+        rows = [
+            (
+                embedding_ids[idx],
                 turn_id,
                 idx,
-                embedding_bytes,
+                self.embedding_manager.serialize_embedding(embedding),
                 chunk_text,
                 self.embedding_manager.dimension,
                 self.embedding_manager.model_name
-            ))
+            )
+            for idx, (chunk_text, embedding) in enumerate(zip(chunks, embeddings))
+        ]
         
-        self.storage.conn.commit()
+        cursor = self.storage.conn.cursor()
+        self.storage.delete_embedding_vectors(embedding_ids)
+        cursor.executemany("""
+            INSERT OR REPLACE INTO embeddings 
+            (embedding_id, turn_id, chunk_index, embedding, text_content, dimension, model_name)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        
+        # Dual-write into the sqlite-vec index (no-op without the extension)
+        self.storage.index_embedding_vectors(
+            embedding_ids,
+            [np.asarray(emb, dtype=np.float32).tobytes() for emb in embeddings]
+        )
+        
+        self.storage.commit()
+        self._append_search_rows(signature_before, turn_id, embedding_ids, chunks, embeddings)
         return len(chunks)
     
     def get_all_embeddings(self) -> List[Tuple[str, np.ndarray, str, str]]:
@@ -244,29 +498,14 @@ class EmbeddingStorage:
             List of results with turn_id, similarity, text
         """
         # Encode query
-        query_embedding = self.embedding_manager.encode(query)
-        
-        # Load all embeddings
-        stored_embeddings = self.get_all_embeddings()
+        query_embedding = self.embedding_manager.encode_cached(query)
         
-        # Also load embeddings from gardened_memory (if table exists)
-        gardened_embeddings = self._get_gardened_embeddings()
+        if getattr(self.storage, 'has_vec0', False):
+            similar = self._search_vec_index(query_embedding, top_k * 3, min_similarity)
+        else:
+            similar = self._search_brute_force(query_embedding, top_k * 3, min_similarity)
         
-        # Combine both sources
-        all_embeddings = stored_embeddings + gardened_embeddings
-        
-        # Find similar (without turn_id for now)
-        similar = self.embedding_manager.find_similar(
-            query_embedding,
-            [(e[0], e[1], e[2]) for e in all_embeddings],
-            top_k=top_k * 3,  # Get more candidates for de-duplication
-            min_similarity=min_similarity
-        )
-        
-        # Add turn_id to results
-        embedding_to_turn = {e[0]: e[3] for e in all_embeddings}
         for result in similar:
-            result['turn_id'] = embedding_to_turn[result['embedding_id']]
             result['query_vector'] = query_embedding  # Attach query vector for visualization
         
         # De-duplicate by turn_id (keep best chunk per turn)
@@ -283,6 +522,215 @@ class EmbeddingStorage:
         
         return final_results
     
+    def _search_vec_index(self, query_embedding: np.ndarray, k: int,
+                          min_similarity: float) -> List[Dict]:
+        """
+        KNN search through the sqlite-vec index.
+        
+        Gardened chunks are stored in the embeddings table keyed by chunk_id,
+        so they are covered by the same index.
+        """
+        neighbours = self.storage.search_embedding_vectors(
+            np.asarray(query_embedding, dtype=np.float32).tobytes(), k
+        )
+        return [
+            {
+                'embedding_id': embedding_id,
+                'similarity': similarity,
+                'text': text,
+                'turn_id': turn_id
+            }
+            for embedding_id, text, turn_id, similarity in neighbours
+            if similarity >= min_similarity
+        ]
+    
+    def _search_brute_force(self, query_embedding: np.ndarray, k: int,
+                            min_similarity: float) -> List[Dict]:
+        """Scan all stored embeddings (used when sqlite-vec is unavailable)."""
+        self._refresh_search_matrix()
+        
+        candidates = self._pca_candidates(query_embedding, k)
+        matrix = self._search_matrix if candidates is None else self._search_matrix[candidates]
+        
+        results = []
+        for i, similarity in self.embedding_manager.top_k_similar(
+            query_embedding, matrix, k, min_similarity
+        ):
+            if candidates is not None:
+                i = int(candidates[i])
+            embedding_id, text, turn_id = self._search_rows[i]
+            results.append({
+                'embedding_id': embedding_id,
+                'similarity': similarity,
+                'text': text,
+                'turn_id': turn_id,
+                'vector': self._search_matrix[i].astype(np.float32)  # Include vector for visualization
+            })
+        
+        return results
+    
+    def _refresh_search_matrix(self):
+        """
+        Rebuild the in-memory search matrix if embeddings changed.
+        
+        Covers both the embeddings table and gardened_memory chunks. The
+        signature is (row count, max rowid) per table, which changes on every
+        insert, replace or delete. Rows added by save_turn_embeddings are
+        appended in place (see _append_search_rows), so this only reloads
+        after deletes, replacements or writes from elsewhere.
+        """
+        signature = self._table_signature()
+        if signature == self._search_signature:
+            return
+        
+        all_embeddings = self.get_all_embeddings() + self._get_gardened_embeddings()
+        
+        if all_embeddings:
+            self._search_matrix = self.embedding_manager.normalize_rows(
+                np.stack([e[1] for e in all_embeddings])
+            ).astype(np.float16)
+        else:
+            self._search_matrix = np.empty((0, self.embedding_manager.dimension), dtype=np.float16)
+        self._search_rows = [(e[0], e[2], e[3]) for e in all_embeddings]
+        self._search_signature = signature
+        self._refresh_pca_matrix()
+    
+    def _append_search_rows(self, signature_before: Optional[tuple], turn_id: str,
+                            embedding_ids: List[str], chunks: List[str],
+                            embeddings: np.ndarray):
+        """
+        Append freshly saved rows to the in-memory search matrix.
+        
+        Saves reloading every embedding from SQLite after each turn. If the
+        matrix was already stale, existing rows were replaced, or the turn
+        is a gardened chunk (joined in again by _get_gardened_embeddings),
+        the signature is dropped and the next search rebuilds in full.
+        """
+        if signature_before is None or signature_before != self._search_signature:
+            return
+        
+        signature = self._table_signature()
+        if (signature[0] != signature_before[0] + len(embedding_ids)
+                or signature[2:] != signature_before[2:]
+                or self._is_gardened_chunk(turn_id)):
+            self._search_signature = None
+            return
+        
+        # Round to FP16 first so rows match what a rebuild would load
+        new_rows = self.embedding_manager.normalize_rows(
+            np.asarray(embeddings, dtype=np.float16)
+        ).astype(np.float16)
+        self._search_matrix = np.concatenate([self._search_matrix, new_rows])
+        self._search_rows.extend(
+            (embedding_id, text, turn_id) for embedding_id, text in zip(embedding_ids, chunks)
+        )
+        self._search_signature = signature
+        
+        # Project just the new rows; a full projection only happens once,
+        # when the matrix first reaches PCA_MIN_ROWS
+        if self._search_matrix_pca is not None:
+            self._search_matrix_pca = np.concatenate(
+                [self._search_matrix_pca, self._project_pca(new_rows)]
+            )
+        else:
+            self._refresh_pca_matrix()
+    
+    def _refresh_pca_matrix(self):
+        """
+        Project the search matrix into PCA space (large memories only).
+        
+        The projection is fitted once per embedding model on a sample of
+        stored rows and persisted in the pca_model table.
+        """
+        if len(self._search_matrix) < self.PCA_MIN_ROWS:
+            self._search_matrix_pca = None
+            return
+        
+        if self._pca is None:
+            self._pca = self._load_or_fit_pca()
+        
+        self._search_matrix_pca = self._project_pca(self._search_matrix)
+    
+    def _project_pca(self, rows: np.ndarray) -> np.ndarray:
+        """Project normalized FP16 rows to P(e - mean), stored as FP16."""
+        components, mean = self._pca
+        return ((rows.astype(np.float32) - mean) @ components.T).astype(np.float16)
+    
+    def _load_or_fit_pca(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Load the persisted PCA projection, fitting and saving one if needed."""
+        manager = self.embedding_manager
+        saved = self.storage.get_pca_model(manager.model_name)
+        
+        if (saved and saved['dimension'] == manager.dimension
+                and saved['n_components'] == self.PCA_COMPONENTS):
+            components = np.frombuffer(saved['components'], dtype=np.float32)
+            mean = np.frombuffer(saved['mean'], dtype=np.float32)
+            return components.reshape(self.PCA_COMPONENTS, manager.dimension), mean
+        
+        print(f"   📐 Fitting PCA projection ({manager.dimension} → {self.PCA_COMPONENTS} dims)...")
+        components, mean = manager.fit_pca(
+            self._search_matrix, self.PCA_COMPONENTS, max_samples=self.PCA_FIT_SAMPLES
+        )
+        self.storage.save_pca_model(
+            manager.model_name,
+            manager.dimension,
+            self.PCA_COMPONENTS,
+            components.tobytes(),
+            mean.tobytes(),
+            min(len(self._search_matrix), self.PCA_FIT_SAMPLES)
+        )
+        return components, mean
+    
+    def _pca_candidates(self, query_embedding: np.ndarray, k: int) -> Optional[np.ndarray]:
+        """
+        First-pass candidate rows from the PCA-reduced matrix.
+        
+        Rows are stored as P(e - mean) and the query as P(q). Their dot
+        product approximates (e - mean) . q, which ranks rows exactly like
+        e . q because mean . q is the same for every row.
+        
+        Returns:
+            Row indices to rerank with full vectors, or None to scan everything
+        """
+        if self._search_matrix_pca is None:
+            return None
+        
+        n_candidates = max(k * self.PCA_RERANK_FACTOR, self.PCA_MIN_CANDIDATES)
+        if n_candidates >= len(self._search_matrix_pca):
+            return None
+        
+        components, _ = self._pca
+        query_pca = components @ np.asarray(query_embedding, dtype=np.float32).ravel()
+        scores = self.embedding_manager.score_rows(self._search_matrix_pca, query_pca)
+        return np.argpartition(-scores, n_candidates)[:n_candidates]
+    
+    def _table_signature(self) -> tuple:
+        """Cheap change detector for the tables feeding the search matrix."""
+        cursor = self.storage.conn.cursor()
+        signature = tuple(cursor.execute("SELECT COUNT(*), MAX(rowid) FROM embeddings").fetchone())
+        
+        cursor.execute("""
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name='gardened_memory'
+        """)
+        if cursor.fetchone():
+            signature += tuple(cursor.execute("SELECT COUNT(*), MAX(rowid) FROM gardened_memory").fetchone())
+        
+        return signature
+    
+    def _is_gardened_chunk(self, chunk_id: str) -> bool:
+        """Whether chunk_id has a row in gardened_memory."""
+        cursor = self.storage.conn.cursor()
+        cursor.execute("""
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name='gardened_memory'
+        """)
+        if not cursor.fetchone():
+            return False
+        
+        cursor.execute("SELECT 1 FROM gardened_memory WHERE chunk_id = ? LIMIT 1", (chunk_id,))
+        return cursor.fetchone() is not None
+    
     def _get_gardened_embeddings(self) -> List[Tuple[str, np.ndarray, str, str]]:
         """
         Get embeddings from gardened_memory chunks.
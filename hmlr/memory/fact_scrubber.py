@@ -16,6 +16,8 @@ Usage:
     facts = scrubber.query_facts(query="HMLR")
 """
 
+import asyncio
+import functools
 import json
 import re
 from typing import List, Dict, Any, Optional
@@ -142,7 +144,7 @@ If no facts found, return: {{"facts": []}}
         """)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_fact_key ON fact_store(key)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_fact_chunk ON fact_store(source_chunk_id)")
-        self.storage.conn.commit()
+        self.storage.commit()
     
     async def extract_and_save(
         self,
@@ -177,10 +179,16 @@ If no facts found, return: {{"facts": []}}
             
             # Use GPT-4.1-mini for fast, cheap extraction
             # ExternalAPIClient.query_external_api returns the content string directly
-            response_content = self.api_client.query_external_api(
-                query=prompt,
-                model="gpt-4.1-mini",  # Fast and cheap for fact extraction
-                max_tokens=500
+            # (sync call - run in executor so it overlaps with the Governor)
+            loop = asyncio.get_event_loop()
+            response_content = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.api_client.query_external_api,
+                    query=prompt,
+                    model="gpt-4.1-mini",  # Fast and cheap for fact extraction
+                    max_tokens=500
+                )
             )
             
             # Parse JSON response
@@ -346,7 +354,7 @@ If no facts found, return: {{"facts": []}}
             fact.source_span_id,
             fact.created_at
         ))
-        self.storage.conn.commit()
+        self.storage.commit()
     
     def query_facts(self, query: str, limit: int = 10) -> List[Fact]:
         """
@@ -391,4 +391,4 @@ Tags:"""
                 tags_json
             ))
         
-        self.storage.conn.commit()
+        self.storage.commit()
@@ -14,6 +14,15 @@ from datetime import datetime, timedelta
 import sys
 import os
 
+import numpy as np
+
+# Optional JIT for the scoring kernel (pip install hmlr[numba])
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Handle imports for both standalone and package contexts
 try:
     from hmlr.memory.models import Intent, RetrievedContext, DayNode, TaskState, Keyword, SlidingWindow
@@ -28,6 +37,72 @@ except ImportError:
     from hmlr.memory import UserPlan
 
 
+# Recency decay tiers: (max days ago, multiplier). Older results get 0.25.
+# Mirrored by the if-chain in the JIT kernel below.
+_RECENCY_TIERS = ((0, 1.0), (7, 0.95), (30, 0.80), (90, 0.60), (365, 0.40))
+_RECENCY_FLOOR = 0.25
+
+
+def _score_kernel_numpy(content_scores, days_ago, dated, task_flags, recency_weight):
+    """NumPy version of the fused relevance score (same arguments as the JIT kernel)."""
+    conditions = [days_ago == 0] + [days_ago <= limit for limit, _ in _RECENCY_TIERS[1:]]
+    multipliers = [mult for _, mult in _RECENCY_TIERS]
+    multiplier = np.select(conditions, multipliers, default=_RECENCY_FLOOR)
+
+    weighted_recency = np.where(
+        dated.astype(bool), 1.0 + (multiplier - 1.0) * recency_weight, 1.0
+    )
+    scores = content_scores * weighted_recency
+    return np.where(task_flags.astype(bool), np.maximum(scores, 0.90), scores)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _score_kernel(content_scores, days_ago, dated, task_flags, recency_weight):
+        """
+        Fused relevance score: content score x weighted recency, task boost.
+
+        Args:
+            content_scores: float64 keyword + topic score per result
+            days_ago: int64 age of each result in days
+            dated: uint8, 1 if the result's day_id parsed as a date
+            task_flags: uint8, 1 for task-related results
+            recency_weight: Share of the score driven by recency (0.0-1.0)
+
+        Returns:
+            float64 array of relevance scores
+        """
+        n = content_scores.shape[0]
+        scores = np.empty(n, dtype=np.float64)
+
+        for i in prange(n):
+            weighted_recency = 1.0
+            if dated[i]:
+                d = days_ago[i]
+                if d == 0:
+                    multiplier = 1.0
+                elif d <= 7:
+                    multiplier = 0.95
+                elif d <= 30:
+                    multiplier = 0.80
+                elif d <= 90:
+                    multiplier = 0.60
+                elif d <= 365:
+                    multiplier = 0.40
+                else:
+                    multiplier = 0.25
+                weighted_recency = 1.0 + (multiplier - 1.0) * recency_weight
+
+            score = content_scores[i] * weighted_recency
+            if task_flags[i] and score < 0.90:
+                score = 0.90
+            scores[i] = score
+
+        return scores
+else:
+    _score_kernel = _score_kernel_numpy
+
+
 class LatticeCrawler:
     """
     Searches memory storage and retrieves relevant context.
@@ -46,7 +121,8 @@ class LatticeCrawler:
         max_days_back: int = None, 
         recency_weight: float = 0.5, 
         use_vector_search: bool = True,
-        use_summaries: bool = True
+        use_summaries: bool = True,
+        embedding_storage: Optional[EmbeddingStorage] = None
     ):
         """Initialize crawler with summary-based retrieval support."""
         self.storage = storage
@@ -56,9 +132,10 @@ class LatticeCrawler:
         self.use_summaries = use_summaries
         
         # Initialize embedding storage if vector search enabled
+        # (reuse a shared instance so the model and embedding cache load once)
         if self.use_vector_search:
             try:
-                self.embedding_storage = EmbeddingStorage(storage)
+                self.embedding_storage = embedding_storage or EmbeddingStorage(storage)
                 print("✅ Vector search enabled (embeddings initialized)")
             except Exception as e:
                 print(f"⚠️  Vector search unavailable: {e}")
@@ -601,8 +678,14 @@ class LatticeCrawler:
         if primary_topics is None:
             primary_topics = []
         
-        for result in results:
-            score = 0.0
+        n = len(results)
+        content_scores = np.zeros(n, dtype=np.float64)
+        days_ago = np.zeros(n, dtype=np.int64)
+        dated = np.zeros(n, dtype=np.uint8)
+        task_flags = np.zeros(n, dtype=np.uint8)
+        now = datetime.now()
+        
+        for i, result in enumerate(results):
             context_lower = result['context'].lower()
             
             # 1. Keyword match score (0.0 to 1.0)
@@ -618,46 +701,28 @@ class LatticeCrawler:
                 topic_score = 0.0
             
             # 3. Combined content score (keywords + topics)
-            content_score = keyword_score + topic_score
+            content_scores[i] = keyword_score + topic_score
             
-            # 4. Recency multiplier (gradual decay, never zero)
+            # 4. Age in days (unparseable day_ids get no recency penalty)
             try:
                 result_date = datetime.strptime(result['day_id'], "%Y-%m-%d")
-                days_ago = (datetime.now() - result_date).days
-                
-                # Decay curve based on recency_weight
-                if days_ago == 0:
-                    recency_multiplier = 1.0                    # Today
-                elif days_ago <= 7:
-                    recency_multiplier = 0.95                   # This week
-                elif days_ago <= 30:
-                    recency_multiplier = 0.80                   # This month
-                elif days_ago <= 90:
-                    recency_multiplier = 0.60                   # This quarter
-                elif days_ago <= 365:
-                    recency_multiplier = 0.40                   # This year
-                else:
-                    recency_multiplier = 0.25                   # Older (still searchable!)
-                
-                # Apply recency weight (user configurable)
-                # recency_weight=0.5 means 50% content, 50% recency
-                weighted_recency = 1.0 + (recency_multiplier - 1.0) * self.recency_weight
-            except:
-                weighted_recency = 1.0
-                days_ago = 0
-            
-            # 5. Final score
-            score = content_score * weighted_recency
+                days_ago[i] = (now - result_date).days
+                dated[i] = 1
+            except (KeyError, TypeError, ValueError):
+                pass
             
-            # 6. Mark if this is a task-related result (for future prioritization)
-            if result.get('is_task_related'):
-                score = max(score, 0.90)  # Boost task-related content
+            # 5. Mark if this is a task-related result (for future prioritization)
+            task_flags[i] = 1 if result.get('is_task_related') else 0
             
-            result['relevance_score'] = score
-            result['days_ago'] = days_ago
+            result['days_ago'] = int(days_ago[i])
             result['keyword_score'] = keyword_score
             result['topic_score'] = topic_score
         
+        # 6. Final score: content x recency decay (see _score_kernel), task boost
+        scores = _score_kernel(content_scores, days_ago, dated, task_flags, float(self.recency_weight))
+        for result, score in zip(results, scores):
+            result['relevance_score'] = float(score)
+        
         # Sort by score (descending)
         sorted_results = sorted(results, key=lambda x: x['relevance_score'], reverse=True)
         
@@ -12,6 +12,7 @@ import json
 import logging
 import re
 import asyncio
+import functools
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
@@ -354,10 +355,15 @@ Return JSON:
 """
             try:
                 # Use fast, cheap model for routing
-                # Note: Wrapping sync call until async API client is available
-                response = self.api_client.query_external_api(
-                    routing_prompt, 
-                    model="gpt-4.1-mini"
+                # Note: Sync client - run in executor so the parallel tasks overlap
+                loop = asyncio.get_event_loop()
+                response = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        self.api_client.query_external_api,
+                        routing_prompt,
+                        model="gpt-4.1-mini"
+                    )
                 )
                 
                 # Parse JSON response
@@ -575,9 +581,14 @@ Return JSON:
                 print(f"\n🧠 Governor: Running 2-key memory filter...")
                 print(f"   Candidates to evaluate: {len(enriched_candidates)}")
                 
-                response = self.api_client.query_external_api(
-                    filter_prompt,
-                    model="gpt-4.1-mini"
+                loop = asyncio.get_event_loop()
+                response = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        self.api_client.query_external_api,
+                        filter_prompt,
+                        model="gpt-4.1-mini"
+                    )
                 )
                 
                 # Parse JSON
@@ -16,10 +16,14 @@ Created: 2025-10-10
 import sqlite3
 import json
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 from pathlib import Path
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Import plan models
@@ -77,12 +81,60 @@ except ImportError:
     )
 
 
+# Hot-path statements. sqlite3 compiles each distinct SQL string once per
+# connection and keeps it in an LRU statement cache, so these stay fixed
+# strings (no per-call formatting or variable-length IN lists) and are
+# reused on every turn without being re-parsed or re-planned.
+_SQL_STAGE_TURN = """
+    INSERT OR REPLACE INTO metadata_staging
+    (turn_id, turn_sequence, session_id, day_id, timestamp, 
+     user_message, assistant_response, keywords, user_summary, 
+     assistant_summary, detected_affect, active_topics, retrieval_sources,
+     summary_id, keyword_ids, affect_ids, task_created_id, 
+     task_updated_ids, loaded_turn_ids, span_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_RECENT_TURNS = """
+    SELECT * FROM metadata_staging
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_SQL_RECENT_TURNS_FOR_DAY = """
+    SELECT * FROM metadata_staging
+    WHERE day_id = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_SQL_COUNT_TURNS = "SELECT COUNT(*) FROM metadata_staging"
+
+_SQL_VEC_DELETE_FOR_EMBEDDING = """
+    DELETE FROM vec_embeddings
+    WHERE rowid = (SELECT rowid FROM embeddings WHERE embedding_id = ?)
+"""
+
+_SQL_VEC_INSERT_FOR_EMBEDDING = """
+    INSERT INTO vec_embeddings(rowid, embedding)
+    SELECT rowid, ? FROM embeddings WHERE embedding_id = ?
+"""
+
+
 class Storage:
     """
     SQLite-based storage layer for the memory system.
     Provides CRUD operations for all memory components.
     """
     
+    # Dimension of the sqlite-vec index (all-MiniLM-L6-v2)
+    VEC_DIMENSION = 384
+    
+    # Per-connection compiled-statement cache. Storage and its callers issue
+    # well over sqlite3's default of 128 distinct statements, which would
+    # evict hot ones.
+    STATEMENT_CACHE_SIZE = 512
+    
     def __init__(self, db_path: str = None):
         """
         Initialize storage with SQLite database.
@@ -97,11 +149,98 @@ class Storage:
         
         self.db_path = db_path
         self.conn = None
+        self.has_vec0 = False
+        self._transaction_depth = 0
+        self._transaction_lock = threading.RLock()
         self._initialize_database()
     
+    def apply_perf_pragmas(self, use_mmap: bool = True) -> None:
+        """
+        Tune the connection for concurrent reads and fewer fsyncs.
+        
+        WAL lets readers (stats queries) proceed while a turn is being
+        written; synchronous=NORMAL is durable in WAL mode and skips the
+        per-commit fsync of the main database.
+        
+        Args:
+            use_mmap: Memory-map up to 256MB of the database file. Disable on
+                      filesystems where I/O errors should not crash the process.
+        """
+        pragmas = [
+            "PRAGMA journal_mode=WAL;",
+            "PRAGMA synchronous=NORMAL;",
+            "PRAGMA cache_size=-64000;",
+            "PRAGMA temp_store=MEMORY;",
+        ]
+        if use_mmap:
+            pragmas.append("PRAGMA mmap_size=268435456;")
+        
+        self.conn.executescript("\n".join(pragmas))
+    
+    @contextmanager
+    def turn_transaction(self):
+        """
+        Group the writes of one turn into a single transaction.
+        
+        Opens BEGIN IMMEDIATE and defers every commit()/rollback() issued
+        by Storage and its collaborators until the block exits, so a turn
+        costs one WAL commit instead of one per write. Commits on success,
+        rolls back if the block raises. Nested use joins the outer
+        transaction.
+        
+        BEGIN IMMEDIATE locks the database against other writers until the
+        block exits, so keep it to the synchronous write phase: never await
+        or call an LLM inside it. Other threads wait for the block to finish
+        before they can open their own or commit.
+        
+        Example:
+            with storage.turn_transaction():
+                conversation_mgr.log_turn(...)
+                embedding_storage.save_turn_embeddings(...)
+        """
+        with self._transaction_lock:
+            if self._transaction_depth == 0:
+                if self.conn.in_transaction:
+                    self.conn.commit()  # Flush pending implicit work first
+                self.conn.execute("BEGIN IMMEDIATE")
+            self._transaction_depth += 1
+            
+            try:
+                yield self
+            except BaseException:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self.conn.rollback()
+                raise
+            
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.conn.commit()
+    
+    def commit(self) -> None:
+        """Commit pending writes (deferred while inside turn_transaction)."""
+        with self._transaction_lock:
+            if self._transaction_depth == 0:
+                self.conn.commit()
+    
+    def rollback(self) -> None:
+        """
+        Roll back pending writes (deferred while inside turn_transaction).
+        
+        SQLite already undoes a failed statement on its own; the enclosing
+        turn transaction decides whether the rest of the turn is kept.
+        """
+        with self._transaction_lock:
+            if self._transaction_depth == 0:
+                self.conn.rollback()
+    
     def _initialize_database(self):
         """Create database and tables if they don't exist"""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE
+        )
         self.conn.row_factory = sqlite3.Row  # Enable dict-like access
         
         cursor = self.conn.cursor()
@@ -237,6 +376,7 @@ class Storage:
             )
         """)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_turn_day ON metadata_staging(day_id, timestamp)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_turn_timestamp ON metadata_staging(timestamp)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_turn_session ON metadata_staging(session_id, turn_sequence)")
         
         # === NEW: SUMMARIES TABLE (with lineage) ===
@@ -468,9 +608,51 @@ class Storage:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_embedding_turn ON embeddings(turn_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_embedding_chunk ON embeddings(turn_id, chunk_index)")
         
-        self.conn.commit()
+        # === PCA MODEL (first-pass projection for brute-force vector search) ===
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS pca_model (
+                model_name TEXT PRIMARY KEY,
+                dimension INTEGER NOT NULL,
+                n_components INTEGER NOT NULL,
+                components BLOB NOT NULL,
+                mean BLOB NOT NULL,
+                fitted_rows INTEGER NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # === VECTOR INDEX (optional, requires sqlite-vec) ===
+        self._initialize_vec_index()
+        
+        self.commit()
         print(f"Storage initialized: {self.db_path}")
     
+    def _initialize_vec_index(self):
+        """
+        Load sqlite-vec and create the vec_embeddings KNN index.
+        
+        vec_embeddings rows share rowids with the embeddings table. If the
+        extension is unavailable (not installed, or Python's sqlite3 was
+        built without extension loading), has_vec0 stays False and vector
+        search falls back to scanning embeddings in Python.
+        """
+        try:
+            import sqlite_vec
+            
+            self.conn.enable_load_extension(True)
+            sqlite_vec.load(self.conn)
+            self.conn.enable_load_extension(False)
+            
+            self.conn.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS vec_embeddings USING vec0(
+                    embedding float[{self.VEC_DIMENSION}] distance_metric=cosine
+                )
+            """)
+            self.has_vec0 = True
+        except Exception as e:
+            logger.info(f"sqlite-vec unavailable, using brute-force vector search: {e}")
+            self.has_vec0 = False
+    
     # =========================================================================
     # DAY NODE OPERATIONS
     # =========================================================================
@@ -507,7 +689,7 @@ class Storage:
                 UPDATE days SET next_day = ? WHERE day_id = ?
             """, (day_id, prev_day_id))
         
-        self.conn.commit()
+        self.commit()
         
         return DayNode(
             day_id=day_id,
@@ -572,7 +754,7 @@ class Storage:
                 INSERT INTO day_sessions (day_id, session_id)
                 VALUES (?, ?)
             """, (day_id, session_id))
-            self.conn.commit()
+            self.commit()
         except sqlite3.IntegrityError:
             # Session already associated with this day
             pass
@@ -638,7 +820,7 @@ class Storage:
                 json.dumps(keyword.turn_ids)
             ))
         
-        self.conn.commit()
+        self.commit()
     
     def get_day_keywords(self, day_id: str) -> List[Keyword]:
         """Get all keywords for a day"""
@@ -745,7 +927,7 @@ class Storage:
             summary.assistant_response_summary,
             json.dumps(summary.keywords_this_turn)
         ))
-        self.conn.commit()
+        self.commit()
     
     def get_day_summaries(self, day_id: str) -> List[Summary]:
         """Get all summaries for a day"""
@@ -819,7 +1001,7 @@ class Storage:
                 json.dumps(affect.turn_ids)
             ))
         
-        self.conn.commit()
+        self.commit()
     
     def get_day_affect(self, day_id: str) -> List[Affect]:
         """Get all affect patterns for a day"""
@@ -882,7 +1064,7 @@ class Storage:
             task.notes,
             json.dumps(task.state_json)
         ))
-        self.conn.commit()
+        self.commit()
     
     def get_task(self, task_id: str) -> Optional[TaskState]:
         """Get a task by ID"""
@@ -951,7 +1133,7 @@ class Storage:
             INSERT INTO task_days (task_id, day_id, event_type, timestamp)
             VALUES (?, ?, ?, ?)
         """, (task_id, day_id, event_type, datetime.now()))
-        self.conn.commit()
+        self.commit()
     
     # =========================================================================
     # METADATA STAGING OPERATIONS (Pre-Synthesis)
@@ -964,15 +1146,7 @@ class Storage:
         Updated for Phase B: Supports new string IDs and lineage references.
         """
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO metadata_staging
-            (turn_id, turn_sequence, session_id, day_id, timestamp, 
-             user_message, assistant_response, keywords, user_summary, 
-             assistant_summary, detected_affect, active_topics, retrieval_sources,
-             summary_id, keyword_ids, affect_ids, task_created_id, 
-             task_updated_ids, loaded_turn_ids, span_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_SQL_STAGE_TURN, (
             turn.turn_id,                           # NEW: String ID like t_...
             turn.turn_sequence,                     # NEW: Sequential number
             turn.session_id,                        # String ID like sess_...
@@ -994,7 +1168,7 @@ class Storage:
             json.dumps(turn.loaded_turn_ids),        # NEW: [t_..., t_...]
             turn.span_id if hasattr(turn, 'span_id') else None  # HMLR v1: span link
         ))
-        self.conn.commit()
+        self.commit()
     
     def get_staged_turns(self, day_id: str) -> List[ConversationTurn]:
         """
@@ -1009,37 +1183,91 @@ class Storage:
             ORDER BY turn_sequence
         """, (day_id,))
         
-        turns = []
-        for row in cursor.fetchall():
-            turns.append(ConversationTurn(
-                turn_id=row['turn_id'],
-                turn_sequence=row['turn_sequence'],        # NEW
-                session_id=row['session_id'],
-                day_id=row['day_id'],
-                timestamp=datetime.fromisoformat(row['timestamp']),
-                user_message=row['user_message'],
-                assistant_response=row['assistant_response'],
-                keywords=json.loads(row['keywords']) if row['keywords'] else [],
-                detected_affect=json.loads(row['detected_affect']) if row['detected_affect'] else [],
-                user_summary=row['user_summary'],
-                assistant_summary=row['assistant_summary'],
-                active_topics=json.loads(row['active_topics']) if row['active_topics'] else [],
-                retrieval_sources=json.loads(row['retrieval_sources']) if row['retrieval_sources'] else [],
-                summary_id=row['summary_id'],              # NEW
-                keyword_ids=json.loads(row['keyword_ids']) if row['keyword_ids'] else [],  # NEW
-                affect_ids=json.loads(row['affect_ids']) if row['affect_ids'] else [],      # NEW
-                task_created_id=row['task_created_id'],    # NEW
-                task_updated_ids=json.loads(row['task_updated_ids']) if row['task_updated_ids'] else [],  # NEW
-                loaded_turn_ids=json.loads(row['loaded_turn_ids']) if row['loaded_turn_ids'] else []      # NEW
-            ))
+        return [self._row_to_turn(row) for row in cursor.fetchall()]
+    
+    def iter_recent_turns(
+        self,
+        day_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[ConversationTurn]:
+        """
+        Stream turns newest first, one row at a time.
+        
+        Rows are decoded lazily from the cursor, so callers that stop early
+        (e.g. itertools.islice) never materialize the rest of the table.
         
+        Args:
+            day_id: Optional day ID to filter by (None = all days)
+            limit: Maximum number of turns (None = no limit)
+        
+        Yields:
+            ConversationTurn objects, most recent first
+        """
+        cursor = self.conn.cursor()
+        sql_limit = limit if limit is not None else -1
+        
+        if day_id:
+            cursor.execute(_SQL_RECENT_TURNS_FOR_DAY, (day_id, sql_limit))
+        else:
+            cursor.execute(_SQL_RECENT_TURNS, (sql_limit,))
+        
+        for row in cursor:
+            yield self._row_to_turn(row)
+    
+    def get_recent_turns(self, day_id: Optional[str] = None, limit: int = 20) -> List[ConversationTurn]:
+        """
+        Get the most recent turns for the sliding window.
+        
+        Args:
+            day_id: Optional day ID to filter by. If None, gets recent turns from all days.
+            limit: Maximum number of turns to retrieve
+        
+        Returns:
+            List of ConversationTurn objects (oldest first, for proper window order)
+        """
+        turns = list(self.iter_recent_turns(day_id=day_id, limit=limit))
+        turns.reverse()
         return turns
     
+    def _row_to_turn(self, row: sqlite3.Row) -> ConversationTurn:
+        """Build a ConversationTurn from a metadata_staging row."""
+        return ConversationTurn(
+            turn_id=row['turn_id'],
+            turn_sequence=row['turn_sequence'],        # NEW
+            session_id=row['session_id'],
+            day_id=row['day_id'],
+            timestamp=datetime.fromisoformat(row['timestamp']),
+            user_message=row['user_message'],
+            assistant_response=row['assistant_response'],
+            keywords=json.loads(row['keywords']) if row['keywords'] else [],
+            detected_affect=json.loads(row['detected_affect']) if row['detected_affect'] else [],
+            user_summary=row['user_summary'],
+            assistant_summary=row['assistant_summary'],
+            active_topics=json.loads(row['active_topics']) if row['active_topics'] else [],
+            retrieval_sources=json.loads(row['retrieval_sources']) if row['retrieval_sources'] else [],
+            summary_id=row['summary_id'],              # NEW
+            keyword_ids=json.loads(row['keyword_ids']) if row['keyword_ids'] else [],  # NEW
+            affect_ids=json.loads(row['affect_ids']) if row['affect_ids'] else [],      # NEW
+            task_created_id=row['task_created_id'],    # NEW
+            task_updated_ids=json.loads(row['task_updated_ids']) if row['task_updated_ids'] else [],  # NEW
+            loaded_turn_ids=json.loads(row['loaded_turn_ids']) if row['loaded_turn_ids'] else []      # NEW
+        )
+    
+    def count_turns(self) -> int:
+        """
+        Count stored conversation turns without loading them.
+        
+        Returns:
+            Number of turns in metadata_staging
+        """
+        result = self.conn.execute(_SQL_COUNT_TURNS).fetchone()
+        return result[0] if result else 0
+    
     def clear_staged_turns(self, day_id: str) -> None:
         """Clear staged turns after synthesis"""
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM metadata_staging WHERE day_id = ?", (day_id,))
-        self.conn.commit()
+        self.commit()
     
     # =========================================================================
     # DAY SYNTHESIS OPERATIONS
@@ -1063,7 +1291,7 @@ class Storage:
             synthesis.narrative_summary,
             json.dumps(synthesis.notable_moments)
         ))
-        self.conn.commit()
+        self.commit()
     
     def get_day_synthesis(self, day_id: str) -> Optional[DaySynthesis]:
         """Get day synthesis if it exists"""
@@ -1155,13 +1383,20 @@ class Storage:
         """
         cursor = self.conn.cursor()
         
+        # The replace gives the row a new rowid; drop the old index entry first
+        self.delete_embedding_vectors([embedding_id])
         cursor.execute("""
             INSERT OR REPLACE INTO embeddings
             (embedding_id, turn_id, chunk_index, embedding, text_content, dimension, model_name)
             VALUES (?, ?, ?, ?, ?, ?, ?)
         """, (embedding_id, turn_id, chunk_index, embedding_bytes, text_content, dimension, model_name))
         
-        self.conn.commit()
+        # Raw FP16 blobs only; legacy pickled rows are indexed after migration
+        if len(embedding_bytes) == self.VEC_DIMENSION * 2:
+            vector = np.frombuffer(embedding_bytes, dtype=np.float16).astype(np.float32)
+            self.index_embedding_vectors([embedding_id], [vector.tobytes()])
+        
+        self.commit()
     
     def get_all_embeddings(self) -> List[tuple]:
         """
@@ -1208,8 +1443,109 @@ class Storage:
             turn_id: Turn identifier
         """
         cursor = self.conn.cursor()
+        if self.has_vec0:
+            cursor.execute("""
+                DELETE FROM vec_embeddings
+                WHERE rowid IN (SELECT rowid FROM embeddings WHERE turn_id = ?)
+            """, (turn_id,))
         cursor.execute("DELETE FROM embeddings WHERE turn_id = ?", (turn_id,))
-        self.conn.commit()
+        self.commit()
+    
+    def delete_embedding_vectors(self, embedding_ids: List[str]):
+        """
+        Remove vector index entries for embeddings about to be replaced.
+        
+        INSERT OR REPLACE gives the embeddings row a new rowid, so the old
+        index entry must be dropped first. Does not commit.
+        
+        Args:
+            embedding_ids: Embedding identifiers
+        """
+        if not self.has_vec0 or not embedding_ids:
+            return
+        
+        self.conn.executemany(_SQL_VEC_DELETE_FOR_EMBEDDING, [(eid,) for eid in embedding_ids])
+    
+    def index_embedding_vectors(self, embedding_ids: List[str], vectors: List[bytes]):
+        """
+        Add embeddings to the sqlite-vec index. Does not commit.
+        
+        Args:
+            embedding_ids: Embedding identifiers (already saved in embeddings)
+            vectors: Raw float32 bytes for each embedding
+        """
+        if not self.has_vec0 or not embedding_ids:
+            return
+        
+        # vec0 has no upsert; clear any stale entry that reused the rowid
+        self.conn.executemany(_SQL_VEC_DELETE_FOR_EMBEDDING, [(eid,) for eid in embedding_ids])
+        self.conn.executemany(_SQL_VEC_INSERT_FOR_EMBEDDING, list(zip(vectors, embedding_ids)))
+    
+    def get_vec_index_count(self) -> int:
+        """
+        Get number of vectors in the sqlite-vec index.
+        
+        Returns:
+            Count of indexed vectors (0 if sqlite-vec is unavailable)
+        """
+        if not self.has_vec0:
+            return 0
+        result = self.conn.execute("SELECT COUNT(*) FROM vec_embeddings").fetchone()
+        return result[0] if result else 0
+    
+    def get_vec_index_mismatch_count(self) -> int:
+        """
+        Count rows where the sqlite-vec index and embeddings disagree.
+        
+        Counts index entries whose rowid has no embeddings row (orphans)
+        plus indexable FP16 embeddings with no index entry. Unlike comparing
+        row counts, an orphan and a missing row do not cancel out.
+        
+        Returns:
+            Number of mismatched rows (0 if sqlite-vec is unavailable)
+        """
+        if not self.has_vec0:
+            return 0
+        orphans = self.conn.execute("""
+            SELECT COUNT(*) FROM vec_embeddings v
+            LEFT JOIN embeddings e ON e.rowid = v.rowid
+            WHERE e.rowid IS NULL
+        """).fetchone()[0]
+        missing = self.conn.execute("""
+            SELECT COUNT(*) FROM embeddings e
+            LEFT JOIN vec_embeddings v ON v.rowid = e.rowid
+            WHERE v.rowid IS NULL AND length(e.embedding) = ?
+        """, (self.VEC_DIMENSION * 2,)).fetchone()[0]
+        return orphans + missing
+    
+    def clear_vec_index(self):
+        """Remove all vectors from the sqlite-vec index. Does not commit."""
+        if self.has_vec0:
+            self.conn.execute("DELETE FROM vec_embeddings")
+    
+    def search_embedding_vectors(self, query_vector: bytes, k: int) -> List[tuple]:
+        """
+        K-nearest-neighbour search over the sqlite-vec index.
+        
+        Args:
+            query_vector: Raw float32 bytes of the query embedding
+            k: Number of neighbours to return
+            
+        Returns:
+            List of (embedding_id, text_content, turn_id, similarity) tuples,
+            most similar first
+        """
+        rows = self.conn.execute("""
+            SELECT e.embedding_id, e.text_content, e.turn_id, knn.distance
+            FROM (
+                SELECT rowid, distance FROM vec_embeddings
+                WHERE embedding MATCH ? AND k = ?
+            ) knn
+            JOIN embeddings e ON e.rowid = knn.rowid
+            ORDER BY knn.distance
+        """, (query_vector, k)).fetchall()
+        
+        return [(row[0], row[1], row[2], 1.0 - row[3]) for row in rows]
     
     def get_embedding_count(self) -> int:
         """
@@ -1222,6 +1558,43 @@ class Storage:
         result = cursor.execute("SELECT COUNT(*) FROM embeddings").fetchone()
         return result[0] if result else 0
     
+    def save_pca_model(self, model_name: str, dimension: int, n_components: int,
+                       components: bytes, mean: bytes, fitted_rows: int):
+        """
+        Persist a fitted PCA projection for an embedding model.
+        
+        Args:
+            model_name: Embedding model the projection was fitted on
+            dimension: Full embedding dimension
+            n_components: Reduced dimension
+            components: Raw float32 bytes of the (n_components, dimension) matrix
+            mean: Raw float32 bytes of the (dimension,) mean vector
+            fitted_rows: Number of embeddings sampled for the fit
+        """
+        self.conn.execute("""
+            INSERT OR REPLACE INTO pca_model
+            (model_name, dimension, n_components, components, mean, fitted_rows)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (model_name, dimension, n_components, components, mean, fitted_rows))
+        self.commit()
+    
+    def get_pca_model(self, model_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the persisted PCA projection for an embedding model.
+        
+        Args:
+            model_name: Embedding model name
+        
+        Returns:
+            Dict with dimension, n_components, components, mean, fitted_rows
+            (components/mean as raw float32 bytes), or None if not fitted
+        """
+        row = self.conn.execute("""
+            SELECT dimension, n_components, components, mean, fitted_rows
+            FROM pca_model WHERE model_name = ?
+        """, (model_name,)).fetchone()
+        return dict(row) if row else None
+    
     # ============================================================================
     # PLANNING SYSTEM METHODS
     # ============================================================================
@@ -1270,7 +1643,7 @@ class Storage:
                 item.completion_time.isoformat() if item.completion_time else None
             ))
         
-        self.conn.commit()
+        self.commit()
     
     def get_user_plan(self, plan_id: str) -> Optional['UserPlan']:
         """
@@ -1393,7 +1766,7 @@ class Storage:
         # Update plan progress
         self._update_plan_progress(plan_id)
         
-        self.conn.commit()
+        self.commit()
     
     def get_active_plans(self) -> List['UserPlan']:
         """
@@ -1564,7 +1937,7 @@ class Storage:
         """, (block_id, f"%{timestamp}%"))
         
         updated_count = cursor.rowcount
-        self.conn.commit()
+        self.commit()
         
         return updated_count
     
@@ -1741,7 +2114,7 @@ class Storage:
                 WHERE block_id = ?
             """, (json.dumps(content), datetime.now().isoformat(), block_id))
             
-            self.conn.commit()
+            self.commit()
             logger.info(f"Appended turn {turn.get('turn_id')} to block {block_id}")
             return True
             
@@ -1786,13 +2159,13 @@ class Storage:
                 WHERE block_id = ?
             """, (new_status, exit_reason, datetime.now().isoformat(), json.dumps(content), block_id))
             
-            self.conn.commit()
+            self.commit()
             logger.info(f"Updated block {block_id} status: {new_status} (reason: {exit_reason})")
             return True
             
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Failed to update status for block {block_id}: {e}")
-            self.conn.rollback()
+            self.rollback()
             return False
 
     def update_last_active_flag(self, block_id: str) -> bool:
@@ -1834,13 +2207,13 @@ class Storage:
                 WHERE block_id = ?
             """, (datetime.now().isoformat(), block_id))
             
-            self.conn.commit()
+            self.commit()
             logger.info(f"Block {block_id} marked as last active for day {day_id}")
             return True
             
         except Exception as e:
             logger.error(f"Failed to update last_active flag: {e}")
-            self.conn.rollback()
+            self.rollback()
             return False
 
     def generate_block_summary(self, block_id: str) -> Optional[str]:
@@ -1884,7 +2257,7 @@ class Storage:
                 WHERE block_id = ?
             """, (json.dumps(content), datetime.now().isoformat(), block_id))
             
-            self.conn.commit()
+            self.commit()
             logger.info(f"Generated summary for block {block_id}: {summary}")
             return summary
             
@@ -1954,13 +2327,13 @@ class Storage:
                 'PENDING'
             ))
             
-            self.conn.commit()
+            self.commit()
             logger.info(f"Created new bridge block: {block_id} (topic: {topic_label})")
             return block_id
             
         except Exception as e:
             logger.error(f"Failed to create bridge block: {e}")
-            self.conn.rollback()
+            self.rollback()
             return None
 
     def update_bridge_block_metadata(self, block_id: str, metadata: Dict[str, Any]) -> bool:
@@ -2020,7 +2393,7 @@ class Storage:
                 WHERE block_id = ?
             """, (json.dumps(content), datetime.now().isoformat(), block_id))
             
-            self.conn.commit()
+            self.commit()
             
             updated_fields = list(metadata.keys())
             logger.info(f"Updated metadata for block {block_id}: {updated_fields}")
@@ -2028,7 +2401,7 @@ class Storage:
             
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Failed to update metadata for block {block_id}: {e}")
-            self.conn.rollback()
+            self.rollback()
             return False
 
     def close(self):
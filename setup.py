@@ -64,6 +64,12 @@ setup(
             "langchain>=0.1.0",
             "langchain-openai>=0.1.0",
         ],
+        "vec": [
+            "sqlite-vec>=0.1.6",
+        ],
+        "numba": [
+            "numba>=0.59.0",
+        ],
         "telemetry": [
             "arize-phoenix>=4.0.0",
             "opentelemetry-api>=1.20.0",
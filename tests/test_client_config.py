@@ -0,0 +1,58 @@
+"""
+Unit tests for HMLRClient configuration forwarding.
+
+Tests cover:
+- use_mmap defaults to True and is forwarded to ComponentFactory
+- Rate-limit settings are forwarded to ComponentFactory
+"""
+import pytest
+
+pytest.importorskip("requests")
+
+from hmlr.client import HMLRClient
+from hmlr.core.component_factory import ComponentFactory
+
+
+class _Captured(Exception):
+    """Raised by the stubbed factory to stop HMLRClient.__init__ early."""
+
+
+@pytest.fixture
+def factory_kwargs(monkeypatch):
+    """Records the keyword arguments HMLRClient passes to the factory."""
+    monkeypatch.setenv("OPENAI_API_KEY", "")
+    monkeypatch.setenv("COGNITIVE_LATTICE_DB", "")
+    captured = {}
+
+    def create_all_components(**kwargs):
+        captured.update(kwargs)
+        raise _Captured()
+
+    monkeypatch.setattr(ComponentFactory, "create_all_components", staticmethod(create_all_components))
+    return captured
+
+
+def _init(**kwargs):
+    with pytest.raises(_Captured):
+        HMLRClient(api_key="test-key", db_path=None, **kwargs)
+
+
+class TestClientConfig:
+    """Test suite for HMLRClient.__init__ keyword forwarding."""
+
+    def test_use_mmap_default(self, factory_kwargs):
+        """Memory-mapping stays on unless the caller opts out."""
+        _init()
+        assert factory_kwargs["use_mmap"] is True
+
+    def test_use_mmap_disabled(self, factory_kwargs):
+        """use_mmap=False reaches the factory instead of being dropped."""
+        _init(use_mmap=False)
+        assert factory_kwargs["use_mmap"] is False
+
+    def test_rate_limits_forwarded(self, factory_kwargs):
+        """Rate-limit settings are passed through unchanged."""
+        _init(requests_per_minute=60, tokens_per_minute=1000, max_concurrent_requests=2)
+        assert factory_kwargs["requests_per_minute"] == 60
+        assert factory_kwargs["tokens_per_minute"] == 1000
+        assert factory_kwargs["max_concurrent_requests"] == 2
@@ -0,0 +1,91 @@
+"""
+Unit tests for the LatticeCrawler relevance scoring kernel.
+
+Tests cover:
+- Recency decay tiers (including tier boundaries) and recency_weight blending
+- Undated results (no recency penalty)
+- Task-related score floor
+- NumPy and Numba kernels agree on random inputs
+
+Every test runs against the NumPy kernel, the Numba JIT kernel and its
+pure-Python body (the latter two are skipped when numba is not installed).
+"""
+import numpy as np
+import pytest
+
+from hmlr.memory.retrieval import crawler
+from hmlr.memory.retrieval.crawler import _score_kernel_numpy
+
+
+def _numba_kernel(py_func=False):
+    if not crawler.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    return crawler._score_kernel.py_func if py_func else crawler._score_kernel
+
+
+@pytest.fixture(params=["numpy", "numba", "numba_py_func"])
+def kernel(request):
+    if request.param == "numpy":
+        return _score_kernel_numpy
+    return _numba_kernel(py_func=request.param == "numba_py_func")
+
+
+def _score(kernel, content, days, dated=1, task=0, recency_weight=0.5):
+    return kernel(
+        np.array([content], dtype=np.float64),
+        np.array([days], dtype=np.int64),
+        np.array([dated], dtype=np.uint8),
+        np.array([task], dtype=np.uint8),
+        recency_weight
+    )[0]
+
+
+class TestScoreKernel:
+    """Test suite for _score_kernel and _score_kernel_numpy."""
+
+    @pytest.mark.parametrize("days,multiplier", [
+        (0, 1.0), (1, 0.95), (7, 0.95), (8, 0.80), (30, 0.80), (31, 0.60),
+        (90, 0.60), (91, 0.40), (365, 0.40), (366, 0.25), (1000, 0.25)
+    ])
+    def test_recency_tiers(self, kernel, days, multiplier):
+        """Each age bucket applies its multiplier, blended by recency_weight."""
+        expected = 1.0 * (1.0 + (multiplier - 1.0) * 0.5)
+        assert _score(kernel, 1.0, days) == pytest.approx(expected)
+
+    def test_undated_has_no_penalty(self, kernel):
+        """Results whose day_id is not a date keep their content score."""
+        assert _score(kernel, 1.2, 1000, dated=0) == pytest.approx(1.2)
+
+    def test_task_floor(self, kernel):
+        """Task-related results score at least 0.90."""
+        assert _score(kernel, 0.1, 0, task=1) == pytest.approx(0.90)
+        assert _score(kernel, 1.4, 0, task=1) == pytest.approx(1.4)
+
+    def test_vectorized(self, kernel):
+        """Scores are computed element-wise across many results."""
+        n = 1000
+        scores = kernel(
+            np.ones(n), np.arange(n, dtype=np.int64),
+            np.ones(n, dtype=np.uint8), np.zeros(n, dtype=np.uint8), 1.0
+        )
+        assert scores.shape == (n,)
+        assert scores[0] == pytest.approx(1.0)
+        assert scores[-1] == pytest.approx(0.25)
+
+
+class TestKernelAgreement:
+    """The JIT kernel's if-chain must match the _RECENCY_TIERS table."""
+
+    def test_numba_matches_numpy(self):
+        """Both kernels give the same scores for the same random inputs."""
+        jit_kernel = _numba_kernel()
+        rng = np.random.default_rng(0)
+        n = 5000
+        args = (
+            rng.uniform(0.0, 1.5, n),
+            rng.integers(0, 800, n, dtype=np.int64),
+            rng.integers(0, 2, n).astype(np.uint8),
+            rng.integers(0, 2, n).astype(np.uint8),
+            0.3
+        )
+        np.testing.assert_allclose(jit_kernel(*args), _score_kernel_numpy(*args), rtol=1e-12)
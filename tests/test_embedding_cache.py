@@ -0,0 +1,98 @@
+"""
+Unit tests for the SHA-256 keyed EmbeddingCache.
+
+Tests cover:
+- Hit/miss accounting and hit rate
+- TTL expiry, LRU capacity and byte cap
+- Model namespaces and the shared process-wide instance
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from hmlr.core.embedding_cache import EmbeddingCache, embedding_cache
+
+
+class TestEmbeddingCache:
+    """Test suite for EmbeddingCache class."""
+
+    @pytest.fixture
+    def cache(self):
+        return EmbeddingCache(max_entries=2)
+
+    def test_round_trip(self, cache):
+        """Cached embedding comes back as the same float32 vector."""
+        vector = np.arange(4, dtype=np.float64)
+        cache.put("hello", vector)
+
+        cached = cache.get("hello")
+        assert cached.dtype == np.float32
+        assert np.array_equal(cached, vector.astype(np.float32))
+
+    def test_hit_rate(self, cache):
+        """Hits and misses are counted per lookup."""
+        assert cache.get("hello") is None
+        cache.put("hello", np.ones(3))
+        assert cache.get("hello") is not None
+
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+    def test_ttl_expiry(self):
+        """Expired entries miss and are dropped."""
+        cache = EmbeddingCache(ttl_seconds=-1)
+        cache.put("hello", np.ones(3))
+
+        assert cache.get("hello") is None
+        assert len(cache) == 0
+
+    def test_lru_capacity(self, cache):
+        """Least recently used entry is evicted past max_entries."""
+        cache.put("a", np.ones(3))
+        cache.put("b", np.ones(3))
+        cache.get("a")
+        cache.put("c", np.ones(3))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_max_bytes(self):
+        """Least recently used entries are evicted past max_bytes."""
+        cache = EmbeddingCache(max_bytes=2 * 4 * 4)  # two 4-D float32 vectors
+        cache.put("a", np.ones(4))
+        cache.put("b", np.ones(4))
+        cache.put("c", np.ones(4))
+
+        assert len(cache) == 2
+        assert cache.nbytes == 32
+        assert cache.get("a") is None
+
+    def test_overwrite_keeps_byte_count(self, cache):
+        """Re-caching the same text replaces its bytes instead of adding."""
+        cache.put("a", np.ones(4))
+        cache.put("a", np.zeros(4))
+
+        assert cache.nbytes == 16
+        assert not cache.get("a").any()
+
+    def test_namespaces_are_separate(self, cache):
+        """Different models never share a cached vector."""
+        cache.put("hello", np.ones(3), namespace="model-a")
+
+        assert cache.get("hello", namespace="model-b") is None
+        assert cache.get("hello", namespace="model-a") is not None
+
+    def test_attach_shares_instance(self):
+        """attach() points an EmbeddingStorage's encoder at the shared cache."""
+        storages = [
+            SimpleNamespace(embedding_manager=SimpleNamespace(cache=EmbeddingCache()))
+            for _ in range(2)
+        ]
+        for storage in storages:
+            embedding_cache.attach(storage)
+
+        assert storages[0].embedding_manager.cache is embedding_cache
+        assert storages[1].embedding_manager.cache is embedding_cache
@@ -0,0 +1,110 @@
+"""
+Unit tests for the ConversationEngine's main-LLM wiring.
+
+Tests cover:
+- create_conversation_engine passes the bundle's ExternalAPIClient
+- _handle_chat reaches query_external_api through the shared RateLimiter
+"""
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("requests")
+
+from hmlr.core import external_api_client
+from hmlr.core.component_factory import ComponentFactory
+from hmlr.core.external_api_client import ExternalAPIClient
+from hmlr.core.rate_limiter import RateLimiter
+
+
+class _Response:
+    status_code = 200
+    headers = {}
+    text = ""
+
+    def json(self):
+        return {"choices": [{"message": {"content": "Hello from the main LLM"}}]}
+
+    def raise_for_status(self):
+        pass
+
+
+class _CountingLimiter(RateLimiter):
+    """RateLimiter that counts granted request slots."""
+
+    def __init__(self):
+        super().__init__()
+        self.acquired = 0
+
+    def acquire(self, estimated_tokens: int = 0) -> None:
+        super().acquire(estimated_tokens)
+        self.acquired += 1
+
+
+class _Governor:
+    async def govern(self, user_query, day_id):
+        return {"is_new_topic": True, "suggested_label": "Greetings"}, [], []
+
+
+def _components(external_api):
+    """ComponentBundle stand-in with just enough for _handle_chat."""
+    storage = SimpleNamespace(
+        get_active_bridge_blocks=lambda: [],
+        create_new_bridge_block=lambda **kwargs: "block_1",
+        get_facts_for_block=lambda block_id: [],
+        update_bridge_block_metadata=lambda block_id, metadata: None,
+        append_turn_to_block=lambda block_id, turn: True,
+        turn_transaction=contextlib.nullcontext,
+    )
+    return SimpleNamespace(
+        storage=storage,
+        sliding_window=None,
+        session_manager=SimpleNamespace(lattice=SimpleNamespace(add_event=lambda event: None)),
+        conversation_mgr=SimpleNamespace(current_day="2025-01-01"),
+        crawler=None,
+        intent_analyzer=None,
+        lattice_retrieval=None,
+        governor=_Governor(),
+        hydrator=None,
+        context_hydrator=SimpleNamespace(hydrate_bridge_block=lambda **kwargs: "prompt"),
+        synthesis_manager=None,
+        user_profile_manager=None,
+        scribe=None,
+        chunk_engine=None,
+        fact_scrubber=None,
+        embedding_storage=None,
+        previous_day="2025-01-01",
+        external_api=external_api,
+    )
+
+
+class TestEngineExternalAPI:
+    """Test suite for the engine's ExternalAPIClient wiring."""
+
+    @pytest.fixture
+    def external_api(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(external_api_client.requests, "get", lambda *args, **kwargs: _Response())
+        monkeypatch.setattr(external_api_client.requests, "post", lambda *args, **kwargs: _Response())
+        return ExternalAPIClient(rate_limiter=_CountingLimiter())
+
+    def test_factory_passes_external_api(self, external_api):
+        """The engine gets the same client the Governor and Scribe use."""
+        engine = ComponentFactory.create_conversation_engine(_components(external_api))
+
+        assert engine.external_api is external_api
+
+    def test_main_llm_goes_through_limiter(self, external_api, monkeypatch):
+        """The main chat completion is sent through the shared rate limiter."""
+        engine = ComponentFactory.create_conversation_engine(_components(external_api))
+        logged = []
+        monkeypatch.setattr(engine, "log_conversation_turn", lambda user, assistant: logged.append(assistant))
+
+        response = asyncio.run(engine._handle_chat("hello"))
+
+        assert response.status.value == "success"
+        assert response.response_text == "Hello from the main LLM"
+        assert external_api.rate_limiter.acquired == 1
+        assert logged == ["Hello from the main LLM"]
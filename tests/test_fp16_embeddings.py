@@ -0,0 +1,110 @@
+"""
+Unit tests for FP16 embedding storage and the legacy pickle migration.
+
+Tests cover:
+- serialize_embedding/deserialize_embedding FP16 round trip
+- Legacy pickled FP32 rows still deserialize
+- _migrate_legacy_embeddings rewrites pickled rows in place (same rowid)
+- Rows of the wrong dimension are left alone
+"""
+import pickle
+
+import numpy as np
+import pytest
+
+from hmlr.memory.embeddings import embedding_manager
+from hmlr.memory.embeddings.embedding_manager import EmbeddingManager, EmbeddingStorage
+from hmlr.memory.storage import Storage
+
+
+class _NullModel:
+    """SentenceTransformer stand-in; these tests never encode text."""
+
+    def encode(self, texts, show_progress_bar=False, batch_size=32):
+        raise AssertionError("unexpected encode call")
+
+
+@pytest.fixture(autouse=True)
+def no_model_download(monkeypatch):
+    monkeypatch.setattr(embedding_manager, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr(embedding_manager, "SentenceTransformer", lambda name: _NullModel(), raising=False)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = Storage(db_path=str(tmp_path / "fp16.db"))
+    yield storage
+    storage.close()
+
+
+def _insert_raw(storage, embedding_id, blob, dimension=384):
+    storage.conn.execute("""
+        INSERT INTO embeddings
+        (embedding_id, turn_id, chunk_index, embedding, text_content, dimension, model_name)
+        VALUES (?, ?, 0, ?, 'text', ?, 'all-MiniLM-L6-v2')
+    """, (embedding_id, f"turn_{embedding_id}", blob, dimension))
+    storage.conn.commit()
+
+
+def _row(storage, embedding_id):
+    return storage.conn.execute(
+        "SELECT rowid, embedding FROM embeddings WHERE embedding_id = ?", (embedding_id,)
+    ).fetchone()
+
+
+class TestFP16Serialization:
+    """Test suite for EmbeddingManager serialize/deserialize."""
+
+    def test_round_trip(self):
+        """Vectors come back as FP16 within half-precision error."""
+        manager = EmbeddingManager()
+        vector = np.random.default_rng(0).standard_normal(384).astype(np.float32)
+
+        blob = manager.serialize_embedding(vector)
+        restored = manager.deserialize_embedding(blob)
+
+        assert len(blob) == 384 * 2
+        assert restored.dtype == np.float16
+        assert np.allclose(restored, vector, atol=1e-2, rtol=1e-3)
+
+    def test_legacy_pickle(self):
+        """Pickled FP32 arrays from older databases still load."""
+        manager = EmbeddingManager()
+        vector = np.arange(384, dtype=np.float32)
+
+        assert np.array_equal(manager.deserialize_embedding(pickle.dumps(vector)), vector)
+
+
+class TestLegacyMigration:
+    """Test suite for EmbeddingStorage._migrate_legacy_embeddings."""
+
+    def test_pickled_row_rewritten_in_place(self, storage):
+        """A pickled FP32 row becomes a 768-byte FP16 blob with the same rowid."""
+        vector = np.random.default_rng(1).standard_normal(384).astype(np.float32)
+        _insert_raw(storage, "legacy", pickle.dumps(vector))
+        rowid_before = _row(storage, "legacy")[0]
+
+        EmbeddingStorage(storage)
+
+        rowid, blob = _row(storage, "legacy")
+        assert rowid == rowid_before
+        assert len(blob) == 768
+        assert np.array_equal(np.frombuffer(blob, dtype=np.float16), vector.astype(np.float16))
+
+    def test_wrong_dimension_left_alone(self, storage):
+        """Pickled vectors of another dimension are not rewritten."""
+        blob = pickle.dumps(np.ones(128, dtype=np.float32))
+        _insert_raw(storage, "other_model", blob, dimension=128)
+
+        EmbeddingStorage(storage)
+
+        assert _row(storage, "other_model")[1] == blob
+
+    def test_fp16_rows_untouched(self, storage):
+        """Rows already stored as FP16 are not selected for migration."""
+        blob = np.ones(384, dtype=np.float16).tobytes()
+        _insert_raw(storage, "current", blob)
+
+        EmbeddingStorage(storage)
+
+        assert _row(storage, "current")[1] == blob
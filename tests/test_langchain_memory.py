@@ -0,0 +1,167 @@
+"""
+Unit tests for the LangChain HMLRMemory write queue.
+
+Tests cover:
+- save_context returns immediately and turns are saved in order
+- Drop-oldest when more than max_pending_saves turns are waiting
+- flush() timeout and success
+- close() saves pending turns before closing the client
+- __del__ does not block on pending saves
+
+When langchain is not installed, a minimal BaseMemory stand-in is put in
+sys.modules for the duration of each test only.
+"""
+import asyncio
+import importlib
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from hmlr.client import HMLRClient
+
+
+def _langchain_stubs():
+    """Minimal langchain modules providing a pydantic BaseMemory."""
+    from pydantic import BaseModel, ConfigDict
+
+    class BaseMemory(BaseModel):
+        model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    memory_module = types.ModuleType("langchain.memory")
+    memory_module.BaseMemory = BaseMemory
+    schema_module = types.ModuleType("langchain.schema")
+    schema_module.BaseMessage = schema_module.HumanMessage = schema_module.AIMessage = object
+    return {
+        "langchain": types.ModuleType("langchain"),
+        "langchain.memory": memory_module,
+        "langchain.schema": schema_module,
+    }
+
+
+class _FakeClient(HMLRClient):
+    """Records saved messages; each chat waits until `gate` is set."""
+
+    def __init__(self, **kwargs):
+        self.saved = []
+        self.closed = False
+        self.started = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()
+
+    async def chat(self, message, force_intent=None, **kwargs):
+        self.started.set()
+        while not self.gate.is_set():
+            await asyncio.sleep(0.001)
+        self.saved.append(message)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def langchain_integration(monkeypatch):
+    """hmlr.integrations.langchain, imported against stubs if langchain is absent."""
+    try:
+        import langchain.memory  # noqa: F401
+        stubbed = False
+    except ImportError:
+        for name, module in _langchain_stubs().items():
+            monkeypatch.setitem(sys.modules, name, module)
+        stubbed = True
+
+    module = importlib.import_module("hmlr.integrations.langchain")
+    monkeypatch.setattr(module, "HMLRClient", _FakeClient)
+    yield module
+
+    # Forget the stub-backed import so later tests see the real environment
+    if stubbed:
+        sys.modules.pop("hmlr.integrations.langchain", None)
+        integrations = sys.modules.get("hmlr.integrations")
+        if integrations is not None and getattr(integrations, "langchain", None) is module:
+            delattr(integrations, "langchain")
+
+
+@pytest.fixture
+def memory(langchain_integration):
+    memory = langchain_integration.HMLRMemory(api_key="test-key", max_pending_saves=2, save_timeout=5.0)
+    yield memory
+    memory.hmlr_client.gate.set()
+    memory.close()
+
+
+def _save(memory, *messages):
+    for message in messages:
+        memory.save_context({"input": message}, {"output": "ok"})
+
+
+class TestWriteQueue:
+    """Test suite for HMLRMemory save_context/flush/close."""
+
+    def test_saves_in_order(self, memory):
+        """Queued turns reach HMLR in the order they were saved."""
+        memory.max_pending_saves = 64
+        _save(memory, "m0", "m1")
+        assert memory.flush()
+        _save(memory, "m2")
+
+        assert memory.flush()
+        assert memory.hmlr_client.saved == ["m0", "m1", "m2"]
+
+    def test_drops_oldest_when_full(self, memory):
+        """Past max_pending_saves, the oldest waiting turn is dropped."""
+        client = memory.hmlr_client
+        client.gate.clear()
+        _save(memory, "m0")
+        assert client.started.wait(5)
+
+        _save(memory, "m1", "m2", "m3")
+        client.gate.set()
+
+        assert memory.flush()
+        assert client.saved == ["m0", "m2", "m3"]
+
+    def test_flush_timeout(self, memory):
+        """flush() reports False while a save is still running."""
+        client = memory.hmlr_client
+        client.gate.clear()
+        _save(memory, "m0")
+
+        assert memory.flush(timeout=0.05) is False
+        client.gate.set()
+        assert memory.flush() is True
+
+    def test_close_saves_pending_then_closes_client(self, memory):
+        """close() drains the queue before closing the client."""
+        _save(memory, "m0", "m1")
+        memory.close()
+
+        assert memory.hmlr_client.saved == ["m0", "m1"]
+        assert memory.hmlr_client.closed
+        assert memory._loop.is_closed()
+        memory.close()  # idempotent
+
+    def test_context_manager(self, langchain_integration):
+        """Leaving the with-block closes the memory."""
+        with langchain_integration.HMLRMemory(api_key="test-key") as memory:
+            _save(memory, "m0")
+
+        assert memory.hmlr_client.saved == ["m0"]
+        assert memory.hmlr_client.closed
+
+    def test_del_does_not_block(self, memory):
+        """__del__ returns immediately even with a save in flight."""
+        client = memory.hmlr_client
+        client.gate.clear()
+        _save(memory, "m0", "m1")
+        assert client.started.wait(5)
+
+        start = time.monotonic()
+        memory.__del__()
+        assert time.monotonic() - start < 0.5
+
+        memory._loop_thread.join(5)
+        assert client.closed
+        assert client.saved == []
@@ -0,0 +1,50 @@
+"""
+Unit tests for the untested-model warning.
+
+Tests cover:
+- HMLRModelWarning is a UserWarning subclass
+- Each model is warned about once per process
+"""
+import warnings
+
+import pytest
+
+from hmlr.client import HMLRClient, HMLRModelWarning
+
+
+class TestModelWarning:
+    """Test suite for HMLRClient._warn_model_once."""
+
+    @pytest.fixture(autouse=True)
+    def reset_warned(self):
+        saved = set(HMLRClient._warned_models)
+        HMLRClient._warned_models.clear()
+        yield
+        HMLRClient._warned_models.clear()
+        HMLRClient._warned_models.update(saved)
+
+    def test_is_user_warning(self):
+        """Existing UserWarning filters still catch it."""
+        assert issubclass(HMLRModelWarning, UserWarning)
+
+    def test_warns_once_per_model(self):
+        """Repeat clients with the same model do not warn again."""
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            HMLRClient._warn_model_once("gpt-4o")
+            HMLRClient._warn_model_once("gpt-4o")
+            HMLRClient._warn_model_once("gpt-5")
+
+        assert [w.category for w in caught] == [HMLRModelWarning, HMLRModelWarning]
+        assert "gpt-4o" in str(caught[0].message)
+        assert "gpt-5" in str(caught[1].message)
+
+    def test_user_filters_take_priority(self):
+        """Importing hmlr.client installs no global warnings filter."""
+        assert not any(f[2] is HMLRModelWarning for f in warnings.filters)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("ignore", UserWarning)
+            HMLRClient._warn_model_once("gpt-4o")
+
+        assert caught == []
@@ -0,0 +1,70 @@
+"""
+Unit tests for the PCA first-pass projection used by vector search.
+
+Tests cover:
+- fit_pca output shapes, orthonormal components and reproducibility
+- Ranking in PCA space matches full-vector ranking on low-rank data
+- pca_model persistence round trip in Storage
+"""
+import numpy as np
+import pytest
+
+from hmlr.memory.embeddings.embedding_manager import EmbeddingManager
+from hmlr.memory.storage import Storage
+
+
+@pytest.fixture
+def embeddings():
+    rng = np.random.default_rng(0)
+    basis = rng.normal(size=(16, 384))
+    return EmbeddingManager.normalize_rows(rng.normal(size=(2000, 16)) @ basis + 1.0)
+
+
+class TestFitPCA:
+    """Test suite for EmbeddingManager.fit_pca."""
+
+    def test_shapes_and_orthonormal(self, embeddings):
+        """Components are (n_components, d) with orthonormal rows."""
+        components, mean = EmbeddingManager.fit_pca(embeddings, 32)
+
+        assert components.shape == (32, 384)
+        assert mean.shape == (384,)
+        assert components.dtype == np.float32
+        assert np.allclose(components @ components.T, np.eye(32), atol=1e-4)
+
+    def test_reproducible(self, embeddings):
+        """Sampled fits are deterministic for a given seed."""
+        first, _ = EmbeddingManager.fit_pca(embeddings, 8, max_samples=500)
+        second, _ = EmbeddingManager.fit_pca(embeddings, 8, max_samples=500)
+
+        assert np.array_equal(first, second)
+
+    def test_preserves_ranking(self, embeddings):
+        """P(e - mean) . P(q) ranks rows like e . q when the data is low-rank."""
+        components, mean = EmbeddingManager.fit_pca(embeddings, 32)
+        projected = (embeddings - mean) @ components.T
+        query = embeddings[7]
+
+        full_top = np.argsort(-(embeddings @ query))[:10]
+        pca_top = np.argsort(-(projected @ (components @ query)))[:10]
+
+        assert list(full_top) == list(pca_top)
+
+
+class TestPCAModelStorage:
+    """Test suite for pca_model persistence."""
+
+    def test_round_trip(self, tmp_path):
+        """A saved projection loads back byte-for-byte."""
+        storage = Storage(db_path=str(tmp_path / "pca.db"))
+        components = np.ones((4, 8), dtype=np.float32)
+        mean = np.zeros(8, dtype=np.float32)
+
+        assert storage.get_pca_model("model") is None
+        storage.save_pca_model("model", 8, 4, components.tobytes(), mean.tobytes(), 100)
+
+        saved = storage.get_pca_model("model")
+        assert saved["n_components"] == 4
+        assert saved["fitted_rows"] == 100
+        assert np.array_equal(np.frombuffer(saved["components"], dtype=np.float32), components.ravel())
+        storage.close()
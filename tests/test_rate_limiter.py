@@ -0,0 +1,72 @@
+"""
+Unit tests for the preemptive OpenAI RateLimiter.
+
+Tests cover:
+- Concurrency cap across threads
+- Adaptive concurrency (halve on 429, grow back on success)
+- Request-per-minute budget
+"""
+import threading
+import time
+
+from hmlr.core.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter class."""
+
+    def test_concurrency_cap(self):
+        """No more than max_concurrent_requests calls run at once."""
+        limiter = RateLimiter(max_concurrent_requests=2)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def call():
+            with limiter.request():
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak[0] == 2
+
+    def test_overload_halves_and_recovers(self):
+        """A 429 halves concurrency; successes grow it back."""
+        limiter = RateLimiter(max_concurrent_requests=8)
+        limiter.record_overload(retry_after=0.01)
+        assert limiter.concurrency_limit == 4
+
+        time.sleep(0.02)
+        for _ in range(50):
+            with limiter.request():
+                pass
+        assert limiter.concurrency_limit == 8
+
+    def test_overload_pauses_requests(self):
+        """Requests wait out the Retry-After pause."""
+        limiter = RateLimiter()
+        limiter.record_overload(retry_after=0.1)
+
+        start = time.monotonic()
+        with limiter.request():
+            pass
+        assert time.monotonic() - start >= 0.09
+
+    def test_requests_per_minute_budget(self):
+        """Requests beyond the RPM budget wait for the window to roll."""
+        limiter = RateLimiter(requests_per_minute=2)
+        limiter.WINDOW_SECONDS = 0.1
+
+        start = time.monotonic()
+        for _ in range(3):
+            with limiter.request():
+                pass
+        assert time.monotonic() - start >= 0.09
@@ -0,0 +1,144 @@
+"""
+Unit tests for the in-memory brute-force search matrix of EmbeddingStorage.
+
+Tests cover:
+- New turn embeddings are appended without reloading from SQLite
+- Appended rows match a full rebuild
+- Replaced and deleted embeddings fall back to a full rebuild
+- Only appended rows are projected into PCA space
+"""
+import hashlib
+
+import numpy as np
+import pytest
+
+from hmlr.memory.embeddings import embedding_manager
+from hmlr.memory.embeddings.embedding_manager import EmbeddingStorage
+from hmlr.memory.storage import Storage
+
+
+class _HashModel:
+    """Deterministic stand-in for SentenceTransformer (no model download)."""
+
+    def encode(self, texts, show_progress_bar=False, batch_size=32):
+        def embed(text):
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+            return np.random.default_rng(seed).standard_normal(384).astype(np.float32)
+
+        if isinstance(texts, str):
+            return embed(texts)
+        return np.stack([embed(text) for text in texts])
+
+
+@pytest.fixture
+def embedding_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_manager, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr(embedding_manager, "SentenceTransformer", lambda name: _HashModel(), raising=False)
+
+    storage = Storage(db_path=str(tmp_path / "search.db"))
+    embedding_storage = EmbeddingStorage(storage)
+    yield embedding_storage
+    storage.close()
+
+
+def _search(embedding_storage, query, k=5):
+    results = embedding_storage._search_brute_force(
+        embedding_storage.embedding_manager.encode(query), k, 0.0
+    )
+    return [(r["embedding_id"], round(r["similarity"], 4)) for r in results]
+
+
+def _rebuilt(embedding_storage):
+    """Fresh EmbeddingStorage over the same database (forces a full load)."""
+    fresh = EmbeddingStorage(embedding_storage.storage)
+    fresh._refresh_search_matrix()
+    return fresh
+
+
+class TestSearchMatrixAppend:
+    """Test suite for EmbeddingStorage._append_search_rows."""
+
+    def test_append_without_reload(self, embedding_storage, monkeypatch):
+        """After the first load, saved turns are searchable without a reload."""
+        embedding_storage.save_turn_embeddings("turn_a", ["python", "rowing"])
+        embedding_storage._refresh_search_matrix()
+
+        def no_reload():
+            raise AssertionError("search matrix reloaded from SQLite")
+
+        monkeypatch.setattr(embedding_storage, "get_all_embeddings", no_reload)
+        embedding_storage.save_turn_embeddings("turn_b", ["tennis", "pizza"])
+
+        assert len(embedding_storage._search_matrix) == 4
+        assert _search(embedding_storage, "tennis", k=1)[0][0] == "turn_b_chunk_0"
+
+    def test_matches_full_rebuild(self, embedding_storage):
+        """Appended rows rank exactly like a matrix loaded from the database."""
+        embedding_storage.save_turn_embeddings("turn_a", ["python", "rowing"])
+        embedding_storage._refresh_search_matrix()
+        embedding_storage.save_turn_embeddings("turn_b", ["tennis", "pizza", "chess"])
+
+        fresh = _rebuilt(embedding_storage)
+
+        assert embedding_storage._search_signature == fresh._search_signature
+        assert np.array_equal(embedding_storage._search_matrix, fresh._search_matrix)
+        assert _search(embedding_storage, "chess") == _search(fresh, "chess")
+
+    def test_replace_triggers_rebuild(self, embedding_storage):
+        """Re-saving a turn replaces rows, so the matrix is reloaded."""
+        embedding_storage.save_turn_embeddings("turn_a", ["python", "rowing"])
+        embedding_storage._refresh_search_matrix()
+        embedding_storage.save_turn_embeddings("turn_a", ["chess", "rowing"])
+
+        assert embedding_storage._search_signature is None
+        assert _search(embedding_storage, "chess", k=1)[0][0] == "turn_a_chunk_0"
+        assert len(embedding_storage._search_matrix) == 2
+
+    def test_delete_triggers_rebuild(self, embedding_storage):
+        """Deleted embeddings disappear from the next search."""
+        embedding_storage.save_turn_embeddings("turn_a", ["python"])
+        embedding_storage.save_turn_embeddings("turn_b", ["tennis"])
+        embedding_storage._refresh_search_matrix()
+
+        embedding_storage.storage.delete_turn_embeddings("turn_b")
+
+        assert [eid for eid, _ in _search(embedding_storage, "tennis")] == ["turn_a_chunk_0"]
+
+
+class TestIncrementalPCA:
+    """Test suite for incremental PCA projection of appended rows."""
+
+    @pytest.fixture
+    def small_pca(self, monkeypatch):
+        monkeypatch.setattr(EmbeddingStorage, "PCA_MIN_ROWS", 8)
+        monkeypatch.setattr(EmbeddingStorage, "PCA_COMPONENTS", 4)
+
+    def test_projects_only_new_rows(self, embedding_storage, small_pca, monkeypatch):
+        """After the first projection, each turn projects just its own rows."""
+        embedding_storage.save_turn_embeddings("turn_a", [f"topic {i}" for i in range(10)])
+        embedding_storage._refresh_search_matrix()
+
+        projected = []
+        project = embedding_storage._project_pca
+        monkeypatch.setattr(
+            embedding_storage, "_project_pca",
+            lambda rows: projected.append(len(rows)) or project(rows)
+        )
+        embedding_storage.save_turn_embeddings("turn_b", ["tennis", "pizza"])
+
+        assert projected == [2]
+        assert embedding_storage._search_matrix_pca.shape == (12, 4)
+        assert np.array_equal(
+            embedding_storage._search_matrix_pca,
+            project(embedding_storage._search_matrix)
+        )
+
+    def test_crossing_threshold_projects_once(self, embedding_storage, small_pca):
+        """The first turn past PCA_MIN_ROWS fits and projects the whole matrix."""
+        embedding_storage.save_turn_embeddings("turn_a", [f"topic {i}" for i in range(6)])
+        embedding_storage._refresh_search_matrix()
+        assert embedding_storage._search_matrix_pca is None
+
+        embedding_storage.save_turn_embeddings("turn_b", ["tennis", "pizza", "chess"])
+
+        assert embedding_storage._search_matrix_pca.shape == (9, 4)
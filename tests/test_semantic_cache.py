@@ -0,0 +1,195 @@
+"""
+Unit tests for the HMLRClient semantic query cache.
+
+Tests cover:
+- Hits on near-duplicate queries, misses on unrelated ones
+- Context (preceding user messages) matching
+- TTL expiry and LRU capacity
+- HMLRClient: cache is opt-in and hits are still logged as turns
+- ConversationEngine.log_cached_turn appends hits to the active Bridge Block
+"""
+import asyncio
+import inspect
+from collections import deque
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from hmlr.client import HMLRClient
+from hmlr.core.semantic_cache import SemanticCache
+
+
+def _vec(*values):
+    return SemanticCache.normalize(np.array(values, dtype=np.float32))
+
+
+class TestSemanticCache:
+    """Test suite for SemanticCache class."""
+
+    @pytest.fixture
+    def cache(self):
+        return SemanticCache(threshold=0.92)
+
+    def test_near_duplicate_hit(self, cache):
+        """A query very close to a cached one returns the cached response."""
+        response = {"content": "Your name is Alice.", "status": "success", "metadata": {}}
+        cache.store(_vec(1.0, 0.0, 0.0), response)
+
+        assert cache.lookup(_vec(0.99, 0.05, 0.0)) == response
+        assert cache.hits == 1
+
+    def test_unrelated_query_miss(self, cache):
+        """An unrelated query misses."""
+        cache.store(_vec(1.0, 0.0, 0.0), {"content": "a", "metadata": {}})
+
+        assert cache.lookup(_vec(0.0, 1.0, 0.0)) is None
+        assert cache.misses == 1
+
+    def test_context_must_match(self, cache):
+        """Same query in a different conversational context misses."""
+        cache.store(_vec(1.0, 0.0, 0.0), {"content": "a", "metadata": {}}, (_vec(0.0, 1.0, 0.0),))
+
+        assert cache.lookup(_vec(1.0, 0.0, 0.0), (_vec(0.0, 0.0, 1.0),)) is None
+        assert cache.lookup(_vec(1.0, 0.0, 0.0)) is None
+        assert cache.lookup(_vec(1.0, 0.0, 0.0), (_vec(0.0, 1.0, 0.0),)) is not None
+
+    def test_every_context_turn_must_match(self, cache):
+        """Contexts matching only on the last turn, or of a different length, miss."""
+        a, b, c = _vec(0.0, 1.0, 0.0), _vec(0.0, 0.0, 1.0), _vec(0.0, 1.0, 1.0)
+        cache.store(_vec(1.0, 0.0, 0.0), {"content": "a", "metadata": {}}, (a, b))
+
+        assert cache.lookup(_vec(1.0, 0.0, 0.0), (c, b)) is None
+        assert cache.lookup(_vec(1.0, 0.0, 0.0), (b,)) is None
+        assert cache.lookup(_vec(1.0, 0.0, 0.0), (a, b)) is not None
+
+    def test_ttl_expiry(self):
+        """Expired entries are never returned."""
+        cache = SemanticCache(ttl_seconds=-1)
+        cache.store(_vec(1.0, 0.0), {"content": "a", "metadata": {}})
+
+        assert cache.lookup(_vec(1.0, 0.0)) is None
+        assert len(cache) == 0
+
+    def test_lru_capacity(self):
+        """Oldest entry is evicted past max_entries."""
+        cache = SemanticCache(max_entries=2)
+        cache.store(_vec(1.0, 0.0, 0.0), {"content": "a", "metadata": {}})
+        cache.store(_vec(0.0, 1.0, 0.0), {"content": "b", "metadata": {}})
+        cache.store(_vec(0.0, 0.0, 1.0), {"content": "c", "metadata": {}})
+
+        assert len(cache) == 2
+        assert cache.lookup(_vec(1.0, 0.0, 0.0)) is None
+        assert cache.lookup(_vec(0.0, 0.0, 1.0))["content"] == "c"
+
+
+class _FakeEngine:
+    """Records calls instead of running Governor/LLM."""
+
+    def __init__(self):
+        self.processed = []
+        self.logged = []
+
+    async def process_user_message(self, message, force_intent=None):
+        self.processed.append(message)
+        return SimpleNamespace(
+            content=f"answer to {message}",
+            status=SimpleNamespace(value="success"),
+            metadata={}
+        )
+
+    def log_cached_turn(self, user_msg, assistant_msg):
+        self.logged.append((user_msg, assistant_msg))
+
+
+def _make_client(vectors, threshold=0.92):
+    """HMLRClient wired to a fake engine and a fixed message -> vector map."""
+    client = HMLRClient.__new__(HMLRClient)
+    client._engine = _FakeEngine()
+    client._sem_cache = SemanticCache(threshold=threshold) if threshold else None
+    client._recent_query_vecs = deque(maxlen=HMLRClient.SEM_CACHE_CONTEXT_TURNS)
+    client._embed_query = lambda message: vectors[message]
+    return client
+
+
+class TestClientSemanticCache:
+    """Test suite for the semantic cache path of HMLRClient.chat."""
+
+    VECTORS = {
+        "what is my name": _vec(1.0, 0.0, 0.0),
+        "What's my name?": _vec(0.99, 0.05, 0.0),
+    }
+
+    def test_disabled_by_default(self):
+        """The cache is opt-in."""
+        default = inspect.signature(HMLRClient.__init__).parameters["sem_cache_threshold"].default
+        assert default is None
+
+    def test_hit_is_logged_as_turn(self):
+        """A cache hit skips the engine but still records the turn."""
+        client = _make_client(self.VECTORS)
+
+        async def run():
+            await client.chat("what is my name")
+            client._recent_query_vecs.clear()  # same (empty) context again
+            return await client.chat("What's my name?")
+
+        result = asyncio.run(run())
+
+        assert result["metadata"]["semantic_cache_hit"] is True
+        assert client.engine.processed == ["what is my name"]
+        assert client.engine.logged == [("What's my name?", "answer to what is my name")]
+
+    def test_different_context_misses(self):
+        """The same question after another turn goes through the engine."""
+        client = _make_client(self.VECTORS)
+
+        async def run():
+            await client.chat("what is my name")
+            await client.chat("What's my name?")
+
+        asyncio.run(run())
+
+        assert client.engine.processed == ["what is my name", "What's my name?"]
+        assert client.engine.logged == []
+
+
+class TestLogCachedTurn:
+    """Test suite for ConversationEngine.log_cached_turn."""
+
+    @pytest.fixture
+    def engine(self, tmp_path, monkeypatch):
+        pytest.importorskip("requests")
+        from hmlr.core.conversation_engine import ConversationEngine
+        from hmlr.memory.storage import Storage
+
+        storage = Storage(db_path=str(tmp_path / "cache_hit.db"))
+        engine = ConversationEngine.__new__(ConversationEngine)
+        engine.storage = storage
+        engine.logged = []
+        monkeypatch.setattr(
+            engine, "log_conversation_turn",
+            lambda user_msg, assistant_msg: engine.logged.append(user_msg)
+        )
+        yield engine
+        storage.close()
+
+    def test_hit_appended_to_active_block(self, engine):
+        """The cached Q/A pair lands in the block history the hydrator reads."""
+        block_id = engine.storage.create_new_bridge_block(
+            day_id="2025-01-01", topic_label="Names", keywords=["name"]
+        )
+
+        engine.log_cached_turn("What's my name?", "Your name is Alice.")
+
+        turns = engine.storage.get_bridge_block_full(block_id)["turns"]
+        assert [(t["user_message"], t["ai_response"]) for t in turns] == [
+            ("What's my name?", "Your name is Alice.")
+        ]
+        assert engine.logged == ["What's my name?"]
+
+    def test_no_active_block(self, engine):
+        """Without an active block the turn is still logged."""
+        engine.log_cached_turn("What's my name?", "Your name is Alice.")
+
+        assert engine.logged == ["What's my name?"]
@@ -0,0 +1,58 @@
+"""
+Unit tests for streaming recent-turn retrieval from Storage.
+
+Tests cover:
+- iter_recent_turns yields newest first and honors limit/day filters
+- get_recent_turns returns the most recent turns in window order
+- count_turns
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from hmlr.memory.models import ConversationTurn
+from hmlr.memory.storage import Storage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = Storage(db_path=str(tmp_path / "turns.db"))
+    start = datetime(2025, 1, 1, 12, 0, 0)
+
+    for i in range(5):
+        storage.stage_turn_metadata(ConversationTurn(
+            turn_id=f"t_{i}",
+            session_id="sess_test",
+            day_id="2025-01-01" if i < 3 else "2025-01-02",
+            timestamp=start + timedelta(hours=i),
+            turn_sequence=i,
+            user_message=f"message {i}",
+            assistant_response=f"response {i}"
+        ))
+
+    yield storage
+    storage.close()
+
+
+class TestRecentTurns:
+    """Test suite for Storage recent-turn retrieval."""
+
+    def test_iter_newest_first(self, storage):
+        """Turns stream most recent first."""
+        ids = [turn.turn_id for turn in storage.iter_recent_turns()]
+        assert ids == ["t_4", "t_3", "t_2", "t_1", "t_0"]
+
+    def test_iter_limit_and_day(self, storage):
+        """limit caps the stream; day_id filters it."""
+        assert [t.turn_id for t in storage.iter_recent_turns(limit=2)] == ["t_4", "t_3"]
+        assert [t.turn_id for t in storage.iter_recent_turns(day_id="2025-01-01")] == ["t_2", "t_1", "t_0"]
+
+    def test_get_recent_turns_window_order(self, storage):
+        """get_recent_turns returns the newest N, oldest first."""
+        turns = storage.get_recent_turns(limit=3)
+        assert [t.turn_id for t in turns] == ["t_2", "t_3", "t_4"]
+        assert turns[0].user_message == "message 2"
+
+    def test_count_turns(self, storage):
+        """count_turns counts without loading rows."""
+        assert storage.count_turns() == 5
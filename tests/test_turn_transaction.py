@@ -0,0 +1,227 @@
+"""
+Unit tests for Storage.turn_transaction.
+
+Tests cover:
+- Writes inside the block commit once, on exit
+- Rollback when the block raises
+- Nested transactions join the outer one
+- Other connections can write while a chat turn awaits its LLM calls
+- Overlapping chat turns commit or roll back only their own writes
+- A rolled-back turn never reaches the sliding window
+"""
+import asyncio
+import sqlite3
+from collections import deque
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from hmlr.client import HMLRClient
+from hmlr.memory.models import ConversationTurn
+from hmlr.memory.storage import Storage
+
+
+def _turn(i):
+    return ConversationTurn(
+        turn_id=f"t_{i}",
+        session_id="sess_test",
+        day_id="2025-01-01",
+        timestamp=datetime(2025, 1, 1, 12, i),
+        turn_sequence=i,
+        user_message=f"message {i}",
+        assistant_response=f"response {i}"
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "tx.db")
+
+
+@pytest.fixture
+def storage(db_path):
+    storage = Storage(db_path=db_path)
+    yield storage
+    storage.close()
+
+
+def _committed_count(db_path):
+    """Count turns as seen by a separate connection (committed data only)."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM metadata_staging").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestTurnTransaction:
+    """Test suite for Storage.turn_transaction."""
+
+    def test_commit_deferred_until_exit(self, storage, db_path):
+        """Per-write commits are deferred; everything lands on exit."""
+        with storage.turn_transaction():
+            storage.stage_turn_metadata(_turn(0))
+            storage.stage_turn_metadata(_turn(1))
+            assert storage.conn.in_transaction
+
+        assert not storage.conn.in_transaction
+        assert _committed_count(db_path) == 2
+
+    def test_rollback_on_error(self, storage):
+        """An exception discards the turn's writes."""
+        with pytest.raises(RuntimeError):
+            with storage.turn_transaction():
+                storage.stage_turn_metadata(_turn(0))
+                raise RuntimeError("boom")
+
+        assert storage.count_turns() == 0
+
+    def test_nested_joins_outer(self, storage):
+        """Inner blocks do not commit; the outer block does."""
+        with storage.turn_transaction():
+            with storage.turn_transaction():
+                storage.stage_turn_metadata(_turn(0))
+            assert storage.conn.in_transaction
+
+        assert not storage.conn.in_transaction
+        assert storage.count_turns() == 1
+
+    def test_commit_outside_transaction(self, storage, db_path):
+        """Outside a turn transaction, writes commit immediately as before."""
+        storage.stage_turn_metadata(_turn(0))
+        assert _committed_count(db_path) == 1
+
+
+class _SlowEngine:
+    """Awaits a fake LLM call, then writes the turn in a turn transaction."""
+
+    def __init__(self, storage, llm_started, llm_release):
+        self.storage = storage
+        self.llm_started = llm_started
+        self.llm_release = llm_release
+
+    async def process_user_message(self, message, force_intent=None):
+        i = int(message)
+        self.llm_started.set()
+        await self.llm_release.wait()
+
+        with self.storage.turn_transaction():
+            self.storage.stage_turn_metadata(_turn(i))
+            if i == 9:
+                raise RuntimeError("write failed")
+
+        return SimpleNamespace(
+            content="ok",
+            status=SimpleNamespace(value="success"),
+            metadata={}
+        )
+
+
+def _make_client(storage, llm_started, llm_release):
+    client = HMLRClient.__new__(HMLRClient)
+    client.components = SimpleNamespace(storage=storage)
+    client._engine = _SlowEngine(storage, llm_started, llm_release)
+    client._sem_cache = None
+    client._recent_query_vecs = deque()
+    return client
+
+
+class TestChatTransactionScope:
+    """The turn transaction must not span the engine's LLM calls."""
+
+    def test_other_connection_writes_during_turn(self, storage, db_path):
+        """A second connection is not locked out while a turn is in flight."""
+
+        async def run():
+            llm_started, llm_release = asyncio.Event(), asyncio.Event()
+            client = _make_client(storage, llm_started, llm_release)
+            turn = asyncio.create_task(client.chat("0"))
+            await llm_started.wait()
+
+            other = Storage(db_path=db_path)
+            other.conn.execute("PRAGMA busy_timeout=100")
+            try:
+                other.stage_turn_metadata(_turn(1))
+            finally:
+                other.close()
+
+            llm_release.set()
+            return await turn
+
+        assert asyncio.run(run())["status"] == "success"
+        assert _committed_count(db_path) == 2
+
+    def test_overlapping_turns_are_isolated(self, storage, db_path):
+        """A failing turn does not roll back a concurrent turn's writes."""
+
+        async def run():
+            llm_started, llm_release = asyncio.Event(), asyncio.Event()
+            client = _make_client(storage, llm_started, llm_release)
+            turns = [asyncio.create_task(client.chat(m)) for m in ("0", "9", "2")]
+            await asyncio.sleep(0)
+            llm_release.set()
+            return await asyncio.gather(*turns, return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        assert isinstance(results[1], RuntimeError)
+        assert _committed_count(db_path) == 2
+        assert storage._transaction_depth == 0
+
+
+class _Window:
+    def __init__(self):
+        self.turns = []
+        self.saved = 0
+
+    def add_turn(self, turn):
+        self.turns.append(turn)
+
+    def save_to_file(self):
+        self.saved += 1
+
+
+class TestLogTurnRollback:
+    """ConversationEngine.log_conversation_turn only windows committed turns."""
+
+    @pytest.fixture
+    def engine(self, storage):
+        pytest.importorskip("requests")
+        from hmlr.core.conversation_engine import ConversationEngine
+
+        def log_turn(**kwargs):
+            turn = _turn(0)
+            turn.keywords = ["greeting"]
+            storage.stage_turn_metadata(turn)
+            return turn
+
+        engine = ConversationEngine.__new__(ConversationEngine)
+        engine.storage = storage
+        engine.sliding_window = _Window()
+        engine.session_manager = SimpleNamespace(lattice=SimpleNamespace(session_id="sess_test"))
+        engine.conversation_mgr = SimpleNamespace(log_turn=log_turn, current_day="2025-01-01")
+        engine.embedding_storage = SimpleNamespace(save_turn_embeddings=lambda turn_id, chunks: len(chunks))
+        engine.previous_day = "2025-01-01"
+        return engine
+
+    def test_committed_turn_windowed(self, engine, storage):
+        """A successful turn is committed and added to the window."""
+        engine.log_conversation_turn("hi", "hello", keywords=[], topics=[], affect="neutral")
+
+        assert storage.count_turns() == 1
+        assert len(engine.sliding_window.turns) == 1
+
+    def test_rolled_back_turn_not_windowed(self, engine, storage):
+        """If the write phase is interrupted, neither the DB nor the window keeps the turn."""
+        def interrupted(turn_id, chunks):
+            raise KeyboardInterrupt
+
+        engine.embedding_storage.save_turn_embeddings = interrupted
+
+        with pytest.raises(KeyboardInterrupt):
+            engine.log_conversation_turn("hi", "hello", keywords=[], topics=[], affect="neutral")
+
+        assert storage.count_turns() == 0
+        assert engine.sliding_window.turns == []
+        assert engine.sliding_window.saved == 0
@@ -0,0 +1,87 @@
+"""
+Unit tests for the sqlite-vec (vec0) KNN index in Storage.
+
+Tests cover:
+- Dual-write: save_embedding indexes the vector alongside the row
+- Replacing an embedding leaves no orphaned or missing index entry
+- KNN search returns nearest embeddings first
+- Mismatch detection when an orphan and a missing row keep counts equal
+
+Skipped when sqlite-vec is not installed or Python's sqlite3 cannot load
+extensions.
+"""
+import numpy as np
+import pytest
+
+from hmlr.memory.storage import Storage
+
+
+def _vec(seed):
+    vector = np.random.default_rng(seed).standard_normal(384).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _save(storage, embedding_id, vector, text="text"):
+    storage.save_embedding(
+        embedding_id, f"turn_{embedding_id}", 0,
+        vector.astype(np.float16).tobytes(), text
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = Storage(db_path=str(tmp_path / "vec.db"))
+    if not storage.has_vec0:
+        storage.close()
+        pytest.skip("sqlite-vec unavailable (extension not installed or not loadable)")
+    yield storage
+    storage.close()
+
+
+class TestVecIndex:
+    """Test suite for Storage's sqlite-vec index maintenance."""
+
+    def test_dual_write(self, storage):
+        """save_embedding writes the table row and its index entry."""
+        _save(storage, "e1", _vec(1))
+        _save(storage, "e2", _vec(2))
+
+        assert storage.get_vec_index_count() == storage.get_embedding_count() == 2
+        assert storage.get_vec_index_mismatch_count() == 0
+
+    def test_replace_reindexes(self, storage):
+        """Replacing an embedding moves its index entry to the new rowid."""
+        _save(storage, "e1", _vec(1), "old")
+        _save(storage, "e2", _vec(2))
+        _save(storage, "e1", _vec(3), "new")
+
+        assert storage.get_vec_index_count() == 2
+        assert storage.get_vec_index_mismatch_count() == 0
+
+        nearest = storage.search_embedding_vectors(_vec(3).tobytes(), 1)
+        assert nearest[0][:2] == ("e1", "new")
+
+    def test_knn_order(self, storage):
+        """Neighbours come back most similar first, with cosine similarity."""
+        query = _vec(1)
+        close = query + 0.1 * _vec(2)
+        _save(storage, "far", _vec(3))
+        _save(storage, "exact", query)
+        _save(storage, "close", close / np.linalg.norm(close))
+
+        results = storage.search_embedding_vectors(query.tobytes(), 3)
+
+        assert [r[0] for r in results] == ["exact", "close", "far"]
+        assert results[0][3] == pytest.approx(1.0, abs=1e-3)
+
+    def test_mismatch_with_equal_counts(self, storage):
+        """An orphaned entry plus an unindexed row is detected despite equal counts."""
+        _save(storage, "e1", _vec(1))
+        storage.conn.execute("""
+            INSERT OR REPLACE INTO embeddings
+            (embedding_id, turn_id, chunk_index, embedding, text_content, dimension, model_name)
+            VALUES ('e1', 'turn_e1', 0, ?, 'text', 384, 'all-MiniLM-L6-v2')
+        """, (_vec(2).astype(np.float16).tobytes(),))
+
+        assert storage.get_vec_index_count() == storage.get_embedding_count()
+        assert storage.get_vec_index_mismatch_count() == 2
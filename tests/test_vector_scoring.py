@@ -0,0 +1,46 @@
+"""
+Unit tests for blockwise FP16 similarity scoring.
+
+Tests cover:
+- score_rows matches a full FP32 matrix-vector product
+- Block boundaries, empty matrices and FP32 passthrough
+"""
+import numpy as np
+import pytest
+
+from hmlr.memory.embeddings.embedding_manager import EmbeddingManager
+
+
+class TestScoreRows:
+    """Test suite for EmbeddingManager.score_rows."""
+
+    @pytest.mark.parametrize("n_rows", [0, 1, 1023, 1024, 1025, 3000])
+    def test_matches_full_product(self, n_rows):
+        """Blockwise FP16 scoring equals widening the whole matrix at once."""
+        rng = np.random.default_rng(n_rows)
+        matrix = rng.standard_normal((n_rows, 384)).astype(np.float16)
+        query = rng.standard_normal(384).astype(np.float32)
+
+        scores = EmbeddingManager.score_rows(matrix, query)
+
+        assert scores.dtype == np.float32
+        assert scores.shape == (n_rows,)
+        assert np.allclose(scores, matrix.astype(np.float32) @ query, atol=1e-3)
+
+    def test_small_blocks(self):
+        """Results do not depend on the block size."""
+        rng = np.random.default_rng(0)
+        matrix = rng.standard_normal((100, 8)).astype(np.float16)
+        query = rng.standard_normal(8).astype(np.float32)
+
+        assert np.allclose(
+            EmbeddingManager.score_rows(matrix, query, block_rows=7),
+            EmbeddingManager.score_rows(matrix, query, block_rows=1000)
+        )
+
+    def test_float32_passthrough(self):
+        """FP32 matrices use a single matrix-vector product."""
+        matrix = np.eye(3, dtype=np.float32)
+        query = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+
+        assert np.array_equal(EmbeddingManager.score_rows(matrix, query), query)